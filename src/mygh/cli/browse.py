@@ -7,7 +7,6 @@ from rich.console import Console
 
 from ..api.client import GitHubClient
 from ..exceptions import APIError, AuthenticationError, MyGHException
-from ..tui.browser import RepositoryBrowser
 
 console = Console()
 browse_app = typer.Typer(help="Interactive repository browser")
@@ -22,6 +21,9 @@ def browse_repositories(
     """Launch interactive repository browser."""
 
     async def run_browser() -> None:
+        # Textual is only imported once a browser is actually launched
+        from ..tui.browser import RepositoryBrowser
+
         try:
             async with GitHubClient() as client:
                 app = RepositoryBrowser(client, username)
@@ -56,6 +58,8 @@ def browse_starred(
     """Launch interactive browser for starred repositories only."""
 
     async def run_starred_browser() -> None:
+        from ..tui.browser import RepositoryBrowser
+
         try:
             async with GitHubClient() as client:
                 # Create a specialized browser for starred repos
@@ -1,6 +1,8 @@
 """Search CLI commands for MyGH."""
 
 import asyncio
+from collections.abc import Coroutine
+from typing import Any
 
 import typer
 from rich.console import Console
@@ -14,6 +16,11 @@ from ..utils.formatting import format_json
 console = Console()
 
 
+def _run(coro: Coroutine[Any, Any, None]) -> None:
+    """Run a search coroutine to completion."""
+    asyncio.run(coro)
+
+
 def validate_repo_sort(sort: str | None) -> None:
     """Validate repository sort option."""
     valid_sorts = ["stars", "forks", "help-wanted-issues", "updated"]
@@ -168,7 +175,7 @@ def search_repos(
                     console.print(format_json(output_data))
 
     try:
-        asyncio.run(_search_repos())
+        _run(_search_repos())
     except AuthenticationError as e:
         console.print(f"[red]Authentication error: {e}[/red]")
         console.print("\n[yellow]To authenticate:[/yellow]")
@@ -279,7 +286,7 @@ def search_users(
                     console.print(format_json(output_data))
 
     try:
-        asyncio.run(_search_users())
+        _run(_search_users())
     except AuthenticationError as e:
         console.print(f"[red]Authentication error: {e}[/red]")
         console.print("\n[yellow]To authenticate:[/yellow]")
@@ -0,0 +1,88 @@
+"""Hand-written test doubles shared across test modules."""
+
+from typing import Any
+
+
+class StubGitHubClient:
+    """Async stand-in for ``GitHubClient`` with scripted results.
+
+    Each keyword argument names a client method and the result it should
+    produce: an exception instance is raised, a tuple yields one element per
+    call (successive pages), and any other value is returned on every call.
+    Every call, including ``close``, is appended to ``calls`` as
+    ``(method, args, kwargs)``. Like the real client it can be used as an
+    async context manager, which closes it on exit.
+    """
+
+    def __init__(self, **results: Any) -> None:
+        self.calls: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+        self._results: dict[str, Any] = {}
+        self.reset(**results)
+
+    def reset(self, **results: Any) -> None:
+        """Forget recorded calls and replace the scripted results."""
+        self.calls.clear()
+        self._results = {
+            name: iter(result) if isinstance(result, tuple) else result for name, result in results.items()
+        }
+
+    def calls_to(self, method: str) -> list[tuple[tuple[Any, ...], dict[str, Any]]]:
+        """Return the ``(args, kwargs)`` of every recorded call to ``method``."""
+        return [(args, kwargs) for name, args, kwargs in self.calls if name == method]
+
+    def _respond(self, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        self.calls.append((method, args, kwargs))
+        result = self._results.get(method)
+        if isinstance(result, BaseException):
+            raise result
+        if hasattr(result, "__next__"):
+            return next(result)
+        return result
+
+    async def __aenter__(self) -> "StubGitHubClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def get_user_repos(self, *args: Any, **kwargs: Any) -> Any:
+        return self._respond("get_user_repos", args, kwargs)
+
+    async def get_repo_issues(self, *args: Any, **kwargs: Any) -> Any:
+        return self._respond("get_repo_issues", args, kwargs)
+
+    async def create_repo(self, *args: Any, **kwargs: Any) -> Any:
+        return self._respond("create_repo", args, kwargs)
+
+    async def update_repo(self, *args: Any, **kwargs: Any) -> Any:
+        return self._respond("update_repo", args, kwargs)
+
+    async def delete_repo(self, *args: Any, **kwargs: Any) -> Any:
+        return self._respond("delete_repo", args, kwargs)
+
+    async def fork_repo(self, *args: Any, **kwargs: Any) -> Any:
+        return self._respond("fork_repo", args, kwargs)
+
+    async def search_repositories(self, *args: Any, **kwargs: Any) -> Any:
+        return self._respond("search_repositories", args, kwargs)
+
+    async def search_users(self, *args: Any, **kwargs: Any) -> Any:
+        return self._respond("search_users", args, kwargs)
+
+    async def get_authenticated_user(self, *args: Any, **kwargs: Any) -> Any:
+        return self._respond("get_authenticated_user", args, kwargs)
+
+    async def get_starred_repos(self, *args: Any, **kwargs: Any) -> Any:
+        return self._respond("get_starred_repos", args, kwargs)
+
+    async def star_repository(self, *args: Any, **kwargs: Any) -> Any:
+        return self._respond("star_repository", args, kwargs)
+
+    async def unstar_repository(self, *args: Any, **kwargs: Any) -> Any:
+        return self._respond("unstar_repository", args, kwargs)
+
+    async def fork_repository(self, *args: Any, **kwargs: Any) -> Any:
+        return self._respond("fork_repository", args, kwargs)
+
+    async def close(self) -> None:
+        self._respond("close", (), {})
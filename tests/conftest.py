@@ -5,25 +5,49 @@ import re
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import patch
 
 import pytest
 from typer.testing import CliRunner
 
-from mygh.api.models import GitHubRepo, GitHubUser
+from mygh.api.models import GitHubIssue, GitHubRepo, GitHubUser
+
+# Plain, fixed-width terminal for CLI invocations so Rich skips colour and
+# terminal-size detection and help/table output is stable across machines.
+CLI_ENV = {"NO_COLOR": "1", "TERM": "dumb", "COLUMNS": "80"}
+
+_ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
 
 def strip_ansi_codes(text: str) -> str:
     """Strip ANSI escape codes from text."""
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-    return ansi_escape.sub("", text)
+    return _ANSI_ESCAPE.sub("", text)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cli_runner():
-    """CLI test runner."""
-    return CliRunner()
+    """Shared CLI test runner.
+
+    ``CliRunner.invoke`` builds a fresh result for every call, so a single
+    instance can safely be reused across the whole session.
+    """
+    return CliRunner(env=CLI_ENV)
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The top-level Typer app, imported on first use."""
+    from mygh.cli.main import app as _app
+
+    return _app
+
+
+@pytest.fixture(scope="session")
+def fake_config():
+    """Minimal stand-in for ``Config`` exposing only ``github_token``."""
+    return SimpleNamespace(github_token="fake_token")
 
 
 @pytest.fixture
@@ -207,6 +231,85 @@ def sample_repo(sample_user) -> GitHubRepo:
     )
 
 
+_JAN_2023 = datetime(2023, 1, 1, tzinfo=timezone.utc)
+_JUN_2023 = datetime(2023, 6, 1, tzinfo=timezone.utc)
+
+# The ``mock_*`` fixtures below are built with ``model_construct`` from trusted
+# static data and shared for the whole session. Treat them as immutable; use
+# ``model_copy(update={...})`` when a test needs a variant.
+
+
+@pytest.fixture(scope="session")
+def mock_user() -> GitHubUser:
+    """Shared GitHubUser instance for CLI tests."""
+    return GitHubUser.model_construct(
+        id=1,
+        login="testuser",
+        avatar_url="https://github.com/images/error/testuser_happy.gif",
+        html_url="https://github.com/testuser",
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_repo(mock_user) -> GitHubRepo:
+    """Shared GitHubRepo instance for CLI tests."""
+    return GitHubRepo.model_construct(
+        id=1,
+        name="test-repo",
+        full_name="testuser/test-repo",
+        description="A test repository",
+        private=False,
+        fork=False,
+        language="Python",
+        stargazers_count=5,
+        watchers_count=3,
+        forks_count=1,
+        open_issues_count=2,
+        size=100,
+        default_branch="main",
+        created_at=_JAN_2023,
+        updated_at=_JUN_2023,
+        pushed_at=_JUN_2023,
+        html_url="https://github.com/testuser/test-repo",
+        clone_url="https://github.com/testuser/test-repo.git",
+        ssh_url="git@github.com:testuser/test-repo.git",
+        license=None,
+        owner=mock_user,
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_issue(mock_user) -> GitHubIssue:
+    """Shared GitHubIssue instance for CLI tests."""
+    return GitHubIssue.model_construct(
+        id=1,
+        number=1,
+        title="Test Issue",
+        body="Test issue body",
+        state="open",
+        user=mock_user,
+        assignee=None,
+        assignees=[],
+        labels=[],
+        created_at=_JAN_2023,
+        updated_at=_JAN_2023,
+        closed_at=None,
+        html_url="https://github.com/testuser/test-repo/issues/1",
+    )
+
+
+@pytest.fixture(scope="session")
+def repo_pages(mock_repo) -> tuple[list[GitHubRepo], ...]:
+    """Two pages of repositories: a full page of 100 followed by a short page of 50."""
+    return ([mock_repo] * 100, [mock_repo] * 50)
+
+
+@pytest.fixture(scope="session")
+def issue_pages(mock_issue) -> tuple[list[GitHubIssue], ...]:
+    """Two pages of issues: a full page of 100 followed by a short page of 30."""
+    return ([mock_issue] * 100, [mock_issue] * 30)
+
+
 @pytest.fixture
 def frozen_time():
     """Freeze time to a specific datetime for consistent testing."""
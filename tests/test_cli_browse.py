@@ -3,18 +3,11 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from typer.testing import CliRunner
 
 from mygh.api.models import GitHubRepo, GitHubUser
 from mygh.cli.main import app
 
 
-@pytest.fixture
-def runner():
-    """Create a CLI test runner."""
-    return CliRunner()
-
-
 @pytest.fixture
 def mock_github_client():
     """Create a mock GitHub client."""
@@ -88,8 +81,8 @@ class TestBrowseCommands:
     """Test the browse CLI commands."""
 
     @patch("mygh.cli.browse.GitHubClient")
-    @patch("mygh.cli.browse.RepositoryBrowser")
-    def test_browse_repos_command(self, mock_browser_class, mock_client_class, runner):
+    @patch("mygh.tui.browser.RepositoryBrowser")
+    def test_browse_repos_command(self, mock_browser_class, mock_client_class, cli_runner):
         """Test the browse repos command."""
         # Setup mocks
         mock_client = AsyncMock()
@@ -101,7 +94,7 @@ class TestBrowseCommands:
         mock_browser_class.return_value = mock_browser
 
         # Run command
-        result = runner.invoke(app, ["browse", "repos"])
+        result = cli_runner.invoke(app, ["browse", "repos"])
 
         # Verify result
         assert result.exit_code == 0
@@ -109,8 +102,8 @@ class TestBrowseCommands:
         mock_browser.run_async.assert_called_once()
 
     @patch("mygh.cli.browse.GitHubClient")
-    @patch("mygh.cli.browse.RepositoryBrowser")
-    def test_browse_repos_with_user(self, mock_browser_class, mock_client_class, runner):
+    @patch("mygh.tui.browser.RepositoryBrowser")
+    def test_browse_repos_with_user(self, mock_browser_class, mock_client_class, cli_runner):
         """Test the browse repos command with specific user."""
         # Setup mocks
         mock_client = AsyncMock()
@@ -122,7 +115,7 @@ class TestBrowseCommands:
         mock_browser_class.return_value = mock_browser
 
         # Run command with user option
-        result = runner.invoke(app, ["browse", "repos", "--user", "testuser"])
+        result = cli_runner.invoke(app, ["browse", "repos", "--user", "testuser"])
 
         # Verify result
         assert result.exit_code == 0
@@ -130,8 +123,8 @@ class TestBrowseCommands:
         mock_browser.run_async.assert_called_once()
 
     @patch("mygh.cli.browse.GitHubClient")
-    @patch("mygh.cli.browse.RepositoryBrowser")
-    def test_browse_repos_keyboard_interrupt(self, mock_browser_class, mock_client_class, runner):
+    @patch("mygh.tui.browser.RepositoryBrowser")
+    def test_browse_repos_keyboard_interrupt(self, mock_browser_class, mock_client_class, cli_runner):
         """Test handling keyboard interrupt in browse repos."""
         # Setup mocks
         mock_client = AsyncMock()
@@ -143,15 +136,15 @@ class TestBrowseCommands:
         mock_browser_class.return_value = mock_browser
 
         # Run command
-        result = runner.invoke(app, ["browse", "repos"])
+        result = cli_runner.invoke(app, ["browse", "repos"])
 
         # Should handle KeyboardInterrupt gracefully
         assert result.exit_code == 0
         assert "Browser closed" in result.stdout
 
     @patch("mygh.cli.browse.GitHubClient")
-    @patch("mygh.cli.browse.RepositoryBrowser")
-    def test_browse_repos_error(self, mock_browser_class, mock_client_class, runner):
+    @patch("mygh.tui.browser.RepositoryBrowser")
+    def test_browse_repos_error(self, mock_browser_class, mock_client_class, cli_runner):
         """Test handling errors in browse repos."""
         # Setup mocks
         mock_client = AsyncMock()
@@ -163,15 +156,15 @@ class TestBrowseCommands:
         mock_browser_class.return_value = mock_browser
 
         # Run command
-        result = runner.invoke(app, ["browse", "repos"])
+        result = cli_runner.invoke(app, ["browse", "repos"])
 
         # Should handle error and exit with code 1
         assert result.exit_code == 1
         assert "Error running browser: Test error" in result.stdout
 
     @patch("mygh.cli.browse.GitHubClient")
-    @patch("mygh.cli.browse.RepositoryBrowser")
-    def test_browse_starred_command(self, mock_browser_class, mock_client_class, runner):
+    @patch("mygh.tui.browser.RepositoryBrowser")
+    def test_browse_starred_command(self, mock_browser_class, mock_client_class, cli_runner):
         """Test the browse starred command."""
         # Setup mocks
         mock_client = AsyncMock()
@@ -183,7 +176,7 @@ class TestBrowseCommands:
         mock_browser_class.return_value = mock_browser
 
         # Run command
-        result = runner.invoke(app, ["browse", "starred"])
+        result = cli_runner.invoke(app, ["browse", "starred"])
 
         # Verify result
         assert result.exit_code == 0
@@ -195,8 +188,8 @@ class TestBrowseCommands:
         assert mock_browser.sub_title == "Your Starred Repositories"
 
     @patch("mygh.cli.browse.GitHubClient")
-    @patch("mygh.cli.browse.RepositoryBrowser")
-    def test_browse_starred_with_user(self, mock_browser_class, mock_client_class, runner):
+    @patch("mygh.tui.browser.RepositoryBrowser")
+    def test_browse_starred_with_user(self, mock_browser_class, mock_client_class, cli_runner):
         """Test the browse starred command with specific user."""
         # Setup mocks
         mock_client = AsyncMock()
@@ -208,7 +201,7 @@ class TestBrowseCommands:
         mock_browser_class.return_value = mock_browser
 
         # Run command with user option
-        result = runner.invoke(app, ["browse", "starred", "--user", "testuser"])
+        result = cli_runner.invoke(app, ["browse", "starred", "--user", "testuser"])
 
         # Verify result
         assert result.exit_code == 0
@@ -222,23 +215,23 @@ class TestBrowseCommands:
 class TestBrowseCommandHelp:
     """Test help output for browse commands."""
 
-    def test_browse_help(self, runner):
+    def test_browse_help(self, cli_runner):
         """Test browse command help."""
-        result = runner.invoke(app, ["browse", "--help"])
+        result = cli_runner.invoke(app, ["browse", "--help"])
         assert result.exit_code == 0
         assert "Interactive repository browser" in result.stdout
 
-    def test_browse_repos_help(self, runner):
+    def test_browse_repos_help(self, cli_runner):
         """Test browse repos command help."""
-        result = runner.invoke(app, ["browse", "repos", "--help"])
+        result = cli_runner.invoke(app, ["browse", "repos", "--help"])
         assert result.exit_code == 0
         assert "Launch interactive repository browser" in result.stdout
         # Check for --user option in different formats (with or without ANSI codes)
         assert "--user" in result.stdout or "-u" in result.stdout
 
-    def test_browse_starred_help(self, runner):
+    def test_browse_starred_help(self, cli_runner):
         """Test browse starred command help."""
-        result = runner.invoke(app, ["browse", "starred", "--help"])
+        result = cli_runner.invoke(app, ["browse", "starred", "--help"])
         assert result.exit_code == 0
         assert "Launch interactive browser for starred repositories" in result.stdout
         # Check for --user option in different formats (with or without ANSI codes)
@@ -250,8 +243,8 @@ class TestBrowseIntegration:
     """Integration tests for browse commands."""
 
     @patch("mygh.cli.browse.GitHubClient")
-    @patch("mygh.cli.browse.RepositoryBrowser")
-    def test_full_browse_workflow(self, mock_browser_class, mock_client_class, runner, sample_repos, sample_user):
+    @patch("mygh.tui.browser.RepositoryBrowser")
+    def test_full_browse_workflow(self, mock_browser_class, mock_client_class, cli_runner, sample_repos, sample_user):
         """Test a complete browse workflow."""
         # Setup mocks
         mock_client = AsyncMock()
@@ -267,37 +260,37 @@ class TestBrowseIntegration:
         mock_browser_class.return_value = mock_browser
 
         # Run browse repos command
-        result = runner.invoke(app, ["browse", "repos", "--user", "testuser"])
+        result = cli_runner.invoke(app, ["browse", "repos", "--user", "testuser"])
 
         # Verify successful execution
         assert result.exit_code == 0
         mock_browser_class.assert_called_once_with(mock_client, "testuser")
         mock_browser.run_async.assert_called_once()
 
-    def test_browse_command_in_main_app(self, runner):
+    def test_browse_command_in_main_app(self, cli_runner):
         """Test that browse command is properly registered in main app."""
-        result = runner.invoke(app, ["--help"])
+        result = cli_runner.invoke(app, ["--help"])
         assert result.exit_code == 0
         assert "browse" in result.stdout
         assert "Interactive repository browser" in result.stdout
 
     @patch("mygh.cli.browse.GitHubClient")
-    @patch("mygh.cli.browse.RepositoryBrowser")
-    def test_browse_starred_authentication_error(self, mock_browser_class, mock_client_class, runner):
+    @patch("mygh.tui.browser.RepositoryBrowser")
+    def test_browse_starred_authentication_error(self, mock_browser_class, mock_client_class, cli_runner):
         """Test handling authentication error in browse starred."""
         # Setup mocks to raise AuthenticationError
         mock_client_class.return_value.__aenter__.side_effect = Exception("Auth test")
 
         # Run command
-        result = runner.invoke(app, ["browse", "starred"])
+        result = cli_runner.invoke(app, ["browse", "starred"])
 
         # Should handle error and exit with code 1
         assert result.exit_code == 1
         assert "Error running starred browser: Auth test" in result.stdout
 
     @patch("mygh.cli.browse.GitHubClient")
-    @patch("mygh.cli.browse.RepositoryBrowser")
-    def test_browse_repos_authentication_handling(self, mock_browser_class, mock_client_class, runner):
+    @patch("mygh.tui.browser.RepositoryBrowser")
+    def test_browse_repos_authentication_handling(self, mock_browser_class, mock_client_class, cli_runner):
         """Test authentication error handling in browse repos."""
         from mygh.exceptions import AuthenticationError
 
@@ -311,7 +304,7 @@ class TestBrowseIntegration:
         mock_browser_class.return_value = mock_browser
 
         # Run command
-        result = runner.invoke(app, ["browse", "repos"])
+        result = cli_runner.invoke(app, ["browse", "repos"])
 
         # Should handle authentication error properly
         assert result.exit_code == 1
@@ -319,8 +312,8 @@ class TestBrowseIntegration:
         assert "To authenticate:" in result.stdout
 
     @patch("mygh.cli.browse.GitHubClient")
-    @patch("mygh.cli.browse.RepositoryBrowser")
-    def test_browse_repos_api_error(self, mock_browser_class, mock_client_class, runner):
+    @patch("mygh.tui.browser.RepositoryBrowser")
+    def test_browse_repos_api_error(self, mock_browser_class, mock_client_class, cli_runner):
         """Test API error handling in browse repos."""
         from mygh.exceptions import APIError
 
@@ -334,15 +327,15 @@ class TestBrowseIntegration:
         mock_browser_class.return_value = mock_browser
 
         # Run command
-        result = runner.invoke(app, ["browse", "repos"])
+        result = cli_runner.invoke(app, ["browse", "repos"])
 
         # Should handle API error properly
         assert result.exit_code == 1
         assert "API error: Rate limit exceeded" in result.stdout
 
     @patch("mygh.cli.browse.GitHubClient")
-    @patch("mygh.cli.browse.RepositoryBrowser")
-    def test_browse_repos_mygh_exception(self, mock_browser_class, mock_client_class, runner):
+    @patch("mygh.tui.browser.RepositoryBrowser")
+    def test_browse_repos_mygh_exception(self, mock_browser_class, mock_client_class, cli_runner):
         """Test MyGH exception handling in browse repos."""
         from mygh.exceptions import MyGHException
 
@@ -356,15 +349,15 @@ class TestBrowseIntegration:
         mock_browser_class.return_value = mock_browser
 
         # Run command
-        result = runner.invoke(app, ["browse", "repos"])
+        result = cli_runner.invoke(app, ["browse", "repos"])
 
         # Should handle MyGH exception properly
         assert result.exit_code == 1
         assert "Error: Custom error" in result.stdout
 
     @patch("mygh.cli.browse.GitHubClient")
-    @patch("mygh.cli.browse.RepositoryBrowser")
-    def test_browse_starred_keyboard_interrupt(self, mock_browser_class, mock_client_class, runner):
+    @patch("mygh.tui.browser.RepositoryBrowser")
+    def test_browse_starred_keyboard_interrupt(self, mock_browser_class, mock_client_class, cli_runner):
         """Test handling keyboard interrupt in browse starred."""
         # Setup mocks
         mock_client = AsyncMock()
@@ -376,15 +369,15 @@ class TestBrowseIntegration:
         mock_browser_class.return_value = mock_browser
 
         # Run command
-        result = runner.invoke(app, ["browse", "starred"])
+        result = cli_runner.invoke(app, ["browse", "starred"])
 
         # Should handle KeyboardInterrupt gracefully
         assert result.exit_code == 0
         assert "Browser closed" in result.stdout
 
     @patch("mygh.cli.browse.GitHubClient")
-    @patch("mygh.cli.browse.RepositoryBrowser")
-    def test_browse_starred_api_error(self, mock_browser_class, mock_client_class, runner):
+    @patch("mygh.tui.browser.RepositoryBrowser")
+    def test_browse_starred_api_error(self, mock_browser_class, mock_client_class, cli_runner):
         """Test API error handling in browse starred."""
         from mygh.exceptions import APIError
 
@@ -398,15 +391,15 @@ class TestBrowseIntegration:
         mock_browser_class.return_value = mock_browser
 
         # Run command
-        result = runner.invoke(app, ["browse", "starred"])
+        result = cli_runner.invoke(app, ["browse", "starred"])
 
         # Should handle API error properly
         assert result.exit_code == 1
         assert "API error: API Error" in result.stdout
 
     @patch("mygh.cli.browse.GitHubClient")
-    @patch("mygh.cli.browse.RepositoryBrowser")
-    def test_browse_starred_mygh_exception(self, mock_browser_class, mock_client_class, runner):
+    @patch("mygh.tui.browser.RepositoryBrowser")
+    def test_browse_starred_mygh_exception(self, mock_browser_class, mock_client_class, cli_runner):
         """Test MyGH exception handling in browse starred."""
         from mygh.exceptions import MyGHException
 
@@ -420,33 +413,33 @@ class TestBrowseIntegration:
         mock_browser_class.return_value = mock_browser
 
         # Run command
-        result = runner.invoke(app, ["browse", "starred"])
+        result = cli_runner.invoke(app, ["browse", "starred"])
 
         # Should handle MyGH exception properly
         assert result.exit_code == 1
         assert "Error: Custom error" in result.stdout
 
     @patch("mygh.cli.browse.GitHubClient")
-    def test_browse_starred_client_context_error(self, mock_client_class, runner):
+    def test_browse_starred_client_context_error(self, mock_client_class, cli_runner):
         """Test client context manager error in browse starred."""
         # Setup mock to raise error on context enter
         mock_client_class.return_value.__aenter__.side_effect = Exception("Connection error")
 
         # Run command
-        result = runner.invoke(app, ["browse", "starred"])
+        result = cli_runner.invoke(app, ["browse", "starred"])
 
         # Should handle client creation error
         assert result.exit_code == 1
         assert "Error running starred browser: Connection error" in result.stdout
 
     @patch("mygh.cli.browse.GitHubClient")
-    def test_browse_repos_client_context_error(self, mock_client_class, runner):
+    def test_browse_repos_client_context_error(self, mock_client_class, cli_runner):
         """Test client context manager error in browse repos."""
         # Setup mock to raise error on context enter
         mock_client_class.return_value.__aenter__.side_effect = Exception("Connection error")
 
         # Run command
-        result = runner.invoke(app, ["browse", "repos"])
+        result = cli_runner.invoke(app, ["browse", "repos"])
 
         # Should handle client creation error
         assert result.exit_code == 1
@@ -3,18 +3,11 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from typer.testing import CliRunner
 
 from mygh.api.models import GitHubRepo, GitHubUser
 from mygh.cli.main import app
 
 
-@pytest.fixture
-def runner():
-    """Create a CLI test runner."""
-    return CliRunner()
-
-
 @pytest.fixture
 def sample_user():
     """Create a sample user for testing."""
@@ -61,9 +54,9 @@ class TestBrowseStarredCoverage:
     """Tests to improve coverage of browse starred command."""
 
     @patch("mygh.cli.browse.GitHubClient")
-    @patch("mygh.cli.browse.RepositoryBrowser")
+    @patch("mygh.tui.browser.RepositoryBrowser")
     def test_browse_starred_with_authenticated_user(
-        self, mock_browser_class, mock_client_class, runner, sample_user, sample_repo
+        self, mock_browser_class, mock_client_class, cli_runner, sample_user, sample_repo
     ):
         """Test browse starred command without user argument (uses authenticated user)."""
         # Setup mocks
@@ -78,7 +71,7 @@ class TestBrowseStarredCoverage:
         mock_browser_class.return_value = mock_browser
 
         # Run command without user argument
-        result = runner.invoke(app, ["browse", "starred"])
+        result = cli_runner.invoke(app, ["browse", "starred"])
 
         # Verify result
         assert result.exit_code == 0
@@ -95,8 +88,8 @@ class TestBrowseStarredCoverage:
         assert sample_repo.starred is True
 
     @patch("mygh.cli.browse.GitHubClient")
-    @patch("mygh.cli.browse.RepositoryBrowser")
-    def test_browse_starred_authentication_error_in_context(self, mock_browser_class, mock_client_class, runner):
+    @patch("mygh.tui.browser.RepositoryBrowser")
+    def test_browse_starred_authentication_error_in_context(self, mock_browser_class, mock_client_class, cli_runner):
         """Test authentication error when creating client context."""
         from mygh.exceptions import AuthenticationError
 
@@ -104,16 +97,16 @@ class TestBrowseStarredCoverage:
         mock_client_class.return_value.__aenter__.side_effect = AuthenticationError("Auth failed")
 
         # Run command
-        result = runner.invoke(app, ["browse", "starred"])
+        result = cli_runner.invoke(app, ["browse", "starred"])
 
         # Should handle authentication error and exit with code 1
         assert result.exit_code == 1
         assert "Authentication error: Auth failed" in result.stdout
 
     @patch("mygh.cli.browse.GitHubClient")
-    @patch("mygh.cli.browse.RepositoryBrowser")
+    @patch("mygh.tui.browser.RepositoryBrowser")
     def test_browse_starred_covers_all_exception_paths(
-        self, mock_browser_class, mock_client_class, runner, sample_user, sample_repo
+        self, mock_browser_class, mock_client_class, cli_runner, sample_user, sample_repo
     ):
         """Test that all exception handling paths are covered in browse starred."""
         # Test that we can access the actual client methods in the context
@@ -128,7 +121,7 @@ class TestBrowseStarredCoverage:
         mock_browser_class.return_value = mock_browser
 
         # Test successful execution to ensure we cover the happy path
-        result = runner.invoke(app, ["browse", "starred"])
+        result = cli_runner.invoke(app, ["browse", "starred"])
         assert result.exit_code == 0
 
         # Verify the async context is properly handled
@@ -141,8 +134,8 @@ class TestBrowseReposCoverage:
     """Tests to improve coverage of browse repos command."""
 
     @patch("mygh.cli.browse.GitHubClient")
-    @patch("mygh.cli.browse.RepositoryBrowser")
-    def test_browse_repos_context_manager_paths(self, mock_browser_class, mock_client_class, runner):
+    @patch("mygh.tui.browser.RepositoryBrowser")
+    def test_browse_repos_context_manager_paths(self, mock_browser_class, mock_client_class, cli_runner):
         """Test that context manager paths are properly covered."""
         # Setup successful context manager flow
         mock_client = AsyncMock()
@@ -154,7 +147,7 @@ class TestBrowseReposCoverage:
         mock_browser_class.return_value = mock_browser
 
         # Test successful execution
-        result = runner.invoke(app, ["browse", "repos"])
+        result = cli_runner.invoke(app, ["browse", "repos"])
 
         # Verify context manager was used properly
         assert result.exit_code == 0
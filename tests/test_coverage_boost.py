@@ -7,7 +7,6 @@ from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
-from typer.testing import CliRunner
 
 from mygh.api.client import GitHubClient
 from mygh.api.models import GitHubRepo, GitHubUser
@@ -114,10 +113,8 @@ class TestAdditionalCoverage:
         assert isinstance(exc, ConfigurationError)
 
     @patch("mygh.cli.main.config_manager")
-    def test_config_command_edge_cases(self, mock_config_manager):
+    def test_config_command_edge_cases(self, mock_config_manager, cli_runner):
         """Test config command edge cases."""
-        cli_runner = CliRunner()
-
         # Test config with invalid key
         mock_config_manager.set_config_value.side_effect = ValueError("Invalid key")
         result = cli_runner.invoke(app, ["config", "set", "invalid-key", "value"])
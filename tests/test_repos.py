@@ -1,912 +1,421 @@
 """Tests for the repos CLI commands."""
 
-from datetime import datetime, timezone
-from unittest.mock import AsyncMock, Mock, patch
+from dataclasses import dataclass
+from unittest.mock import Mock
 
 import pytest
-from typer.testing import CliRunner
 
-from mygh.api.models import GitHubIssue, GitHubRepo, GitHubUser
-from mygh.cli.main import app
+from mygh.cli.repos import repo_issues, repos_app, repos_list
 from mygh.exceptions import APIError, AuthenticationError, MyGHException
 
+from ._stubs import StubGitHubClient
 
-class TestReposCommands:
-    """Test the repos CLI commands."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create a CLI runner."""
-        return CliRunner()
-
-    @pytest.fixture
-    def mock_user(self):
-        """Create a mock GitHub user."""
-        return GitHubUser(
-            login="testuser",
-            id=1,
-            node_id="MDQ6VXNlcjE=",
-            avatar_url="https://github.com/images/error/testuser_happy.gif",
-            gravatar_id="",
-            url="https://api.github.com/users/testuser",
-            html_url="https://github.com/testuser",
-            followers_url="https://api.github.com/users/testuser/followers",
-            following_url="https://api.github.com/users/testuser/following{/other_user}",
-            gists_url="https://api.github.com/users/testuser/gists{/gist_id}",
-            starred_url="https://api.github.com/users/testuser/starred{/owner}{/repo}",
-            subscriptions_url="https://api.github.com/users/testuser/subscriptions",
-            organizations_url="https://api.github.com/users/testuser/orgs",
-            repos_url="https://api.github.com/users/testuser/repos",
-            events_url="https://api.github.com/users/testuser/events{/privacy}",
-            received_events_url="https://api.github.com/users/testuser/received_events",
-            type="User",
-            site_admin=False,
-        )
+@pytest.fixture(scope="module", autouse=True)
+def patched_client(fake_config):
+    """Replace the repos module's config lookup and GitHub client for this module.
 
-    @pytest.fixture
-    def mock_repo(self, mock_user):
-        """Create a mock GitHub repository."""
-        return GitHubRepo(
-            id=1,
-            node_id="MDEwOlJlcG9zaXRvcnkx",
-            name="test-repo",
-            full_name="testuser/test-repo",
-            private=False,
-            owner=mock_user,
-            html_url="https://github.com/testuser/test-repo",
-            description="A test repository",
-            fork=False,
-            url="https://api.github.com/repos/testuser/test-repo",
-            created_at=datetime(2023, 1, 1, tzinfo=timezone.utc),
-            updated_at=datetime(2023, 6, 1, tzinfo=timezone.utc),
-            pushed_at=datetime(2023, 6, 1, tzinfo=timezone.utc),
-            clone_url="https://github.com/testuser/test-repo.git",
-            ssh_url="git@github.com:testuser/test-repo.git",
-            size=100,
-            stargazers_count=5,
-            watchers_count=3,
-            language="Python",
-            has_issues=True,
-            has_projects=True,
-            has_wiki=True,
-            has_pages=False,
-            has_downloads=True,
-            archived=False,
-            disabled=False,
-            open_issues_count=2,
-            license=None,
-            forks_count=1,
-            open_issues=2,
-            watchers=3,
-            default_branch="main",
-            topics=["python", "testing"],
-        )
+    Yields the shared ``StubGitHubClient`` every command in the module talks to.
+    """
+    client = StubGitHubClient()
 
-    @pytest.fixture
-    def mock_issue(self, mock_user):
-        """Create a mock GitHub issue."""
-        return GitHubIssue(
-            id=1,
-            node_id="MDU6SXNzdWUx",
-            number=1,
-            title="Test Issue",
-            user=mock_user,
-            labels=[],
-            state="open",
-            locked=False,
-            assignee=None,
-            assignees=[],
-            milestone=None,
-            comments=0,
-            created_at=datetime(2023, 1, 1, tzinfo=timezone.utc),
-            updated_at=datetime(2023, 1, 1, tzinfo=timezone.utc),
-            closed_at=None,
-            author_association="OWNER",
-            body="Test issue body",
-            html_url="https://github.com/testuser/test-repo/issues/1",
-            url="https://api.github.com/repos/testuser/test-repo/issues/1",
-        )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("mygh.cli.repos.config_manager.get_config", lambda: fake_config)
+        mp.setattr("mygh.cli.repos.GitHubClient", lambda *args, **kwargs: client)
+        yield client
 
-    def test_repos_list_help(self, runner):
-        """Test repos list command help."""
-        result = runner.invoke(app, ["repos", "list", "--help"])
-        assert result.exit_code == 0
-        assert "List repositories" in result.stdout
 
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
-    @pytest.mark.api_mock
-    def test_repos_list_basic(self, mock_client_class, mock_config_manager, runner, mock_repo):
-        """Test basic repository listing."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
+@pytest.fixture(autouse=True)
+def reset_client(patched_client):
+    """Clear the shared stub's calls and scripted results after each test."""
+    yield
+    patched_client.reset()
 
-        mock_client = AsyncMock()
-        mock_client.get_user_repos = AsyncMock(return_value=[mock_repo])
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
 
-        result = runner.invoke(app, ["repos", "list"])
+@pytest.fixture
+def script_client(patched_client):
+    """Return a helper that resets and scripts the shared ``StubGitHubClient``.
 
-        assert result.exit_code == 0
-        mock_client.get_user_repos.assert_called_once()
-        mock_client.close.assert_called_once()
+    Every call returns the same stub, so a second call in one test replaces
+    the results scripted by the first.
+    """
 
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
-    @pytest.mark.api_mock
-    def test_repos_list_with_username(self, mock_client_class, mock_config_manager, runner, mock_repo):
-        """Test repository listing with username."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
+    def _script(**method_results):
+        patched_client.reset(**method_results)
+        return patched_client
 
-        mock_client = AsyncMock()
-        mock_client.get_user_repos = AsyncMock(return_value=[mock_repo])
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
+    return _script
 
-        result = runner.invoke(app, ["repos", "list", "testuser"])
 
-        assert result.exit_code == 0
-        mock_client.get_user_repos.assert_called_once()
-        mock_client.close.assert_called_once()
+@pytest.fixture
+def cli_args(request):
+    """Argument vector for an indirectly parametrized CLI invocation.
 
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
-    @pytest.mark.api_mock
-    def test_repos_list_with_options(self, mock_client_class, mock_config_manager, runner, mock_repo):
-        """Test repository listing with various options."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        mock_client.get_user_repos = AsyncMock(return_value=[mock_repo])
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
-
-        result = runner.invoke(
-            app,
-            [
-                "repos",
-                "list",
-                "testuser",
-                "--type",
-                "public",
-                "--sort",
-                "created",
-                "--limit",
-                "10",
-                "--format",
-                "json",
-            ],
-        )
+    A fresh copy is handed out so a test can never mutate the shared
+    parametrize value seen by the next case.
+    """
+    return list(request.param)
 
-        assert result.exit_code == 0
-        mock_client.get_user_repos.assert_called_once()
-        mock_client.close.assert_called_once()
 
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
-    @pytest.mark.api_mock
-    def test_repos_list_empty_result(self, mock_client_class, mock_config_manager, runner):
-        """Test repository listing with empty result."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
+@dataclass
+class PatchedPrompts:
+    """Mocked Rich prompts installed into ``mygh.cli.repos``."""
 
-        mock_client = AsyncMock()
-        mock_client.get_user_repos = AsyncMock(return_value=[])
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
+    prompt: Mock
+    confirm: Mock
 
-        result = runner.invoke(app, ["repos", "list"])
 
-        assert result.exit_code == 0
-        assert "No repositories found" in result.stdout
-        mock_client.close.assert_called_once()
+@pytest.fixture
+def prompts(monkeypatch):
+    """Replace ``Prompt.ask`` and ``Confirm.ask`` with mocks tests can script."""
+    prompt_ask = Mock()
+    confirm_ask = Mock()
+    monkeypatch.setattr("mygh.cli.repos.Prompt.ask", prompt_ask)
+    monkeypatch.setattr("mygh.cli.repos.Confirm.ask", confirm_ask)
+    return PatchedPrompts(prompt=prompt_ask, confirm=confirm_ask)
+
+
+class TestReposCommands:
+    """Test the repos CLI commands."""
 
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
     @pytest.mark.api_mock
-    def test_repos_list_pagination(self, mock_client_class, mock_config_manager, runner, mock_repo):
-        """Test repository listing with pagination."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        # Simulate pagination - first call returns 100 repos, second returns fewer
-        mock_client.get_user_repos = AsyncMock(
-            side_effect=[
-                [mock_repo] * 100,  # First page
-                [mock_repo] * 50,  # Second page (less than per_page)
-            ]
-        )
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
+    @pytest.mark.parametrize(
+        ("cli_args", "mocked_method", "payload", "expected_output"),
+        [
+            pytest.param(["repos", "list"], "get_user_repos", "repos", None, id="list-basic"),
+            pytest.param(["repos", "list", "testuser"], "get_user_repos", "repos", None, id="list-username"),
+            pytest.param(
+                [
+                    "repos",
+                    "list",
+                    "testuser",
+                    "--type",
+                    "public",
+                    "--sort",
+                    "created",
+                    "--limit",
+                    "10",
+                    "--format",
+                    "json",
+                ],
+                "get_user_repos",
+                "repos",
+                None,
+                id="list-options",
+            ),
+            pytest.param(["repos", "info", "testuser/test-repo"], "get_user_repos", "repos", None, id="info-basic"),
+            pytest.param(
+                ["repos", "issues", "testuser/test-repo"], "get_repo_issues", "issues", None, id="issues-basic"
+            ),
+            pytest.param(
+                [
+                    "repos",
+                    "issues",
+                    "testuser/test-repo",
+                    "--state",
+                    "closed",
+                    "--assignee",
+                    "@me",
+                    "--labels",
+                    "bug,enhancement",
+                    "--limit",
+                    "50",
+                    "--format",
+                    "json",
+                ],
+                "get_repo_issues",
+                "issues",
+                None,
+                id="issues-options",
+            ),
+            pytest.param(
+                ["repos", "create", "new-repo"],
+                "create_repo",
+                "repo",
+                "Repository 'testuser/test-repo' created successfully!",
+                id="create-basic",
+            ),
+            pytest.param(
+                [
+                    "repos",
+                    "create",
+                    "new-repo",
+                    "--description",
+                    "A new repository",
+                    "--private",
+                    "--no-issues",
+                    "--no-wiki",
+                    "--gitignore",
+                    "Python",
+                    "--license",
+                    "MIT",
+                ],
+                "create_repo",
+                "repo",
+                None,
+                id="create-options",
+            ),
+            pytest.param(
+                ["repos", "update", "testuser/test-repo", "--description", "Updated description"],
+                "update_repo",
+                "repo",
+                "Repository 'testuser/test-repo' updated successfully!",
+                id="update-basic",
+            ),
+            pytest.param(
+                [
+                    "repos",
+                    "update",
+                    "testuser/test-repo",
+                    "--description",
+                    "Updated description",
+                    "--homepage",
+                    "https://example.com",
+                    "--private",
+                    "--no-issues",
+                    "--no-wiki",
+                    "--no-projects",
+                    "--no-squash",
+                    "--no-merge",
+                    "--no-rebase",
+                    "--keep-branch",
+                    "--archive",
+                ],
+                "update_repo",
+                "repo",
+                None,
+                id="update-all-options",
+            ),
+            pytest.param(
+                ["repos", "fork", "testuser/test-repo"],
+                "fork_repo",
+                "repo",
+                "Repository 'testuser/test-repo' forked successfully!",
+                id="fork-basic",
+            ),
+            pytest.param(
+                ["repos", "fork", "testuser/test-repo", "--org", "myorg"],
+                "fork_repo",
+                "repo",
+                None,
+                id="fork-organization",
+            ),
+        ],
+        indirect=["cli_args"],
+    )
+    def test_repos_happy_path(
+        self, script_client, cli_runner, app, mock_repo, mock_issue, cli_args, mocked_method, payload, expected_output
+    ):
+        """Test that each repos subcommand calls the client and closes it."""
+        payloads = {"repos": [mock_repo], "issues": [mock_issue], "repo": mock_repo}
+        client = script_client(**{mocked_method: payloads[payload]})
 
-        result = runner.invoke(app, ["repos", "list", "--limit", "150"])
+        result = cli_runner.invoke(app, cli_args)
 
         assert result.exit_code == 0
-        assert mock_client.get_user_repos.call_count == 2
-        mock_client.close.assert_called_once()
-
-    def test_repos_info_help(self, runner):
-        """Test repos info command help."""
-        result = runner.invoke(app, ["repos", "info", "--help"])
+        if expected_output is not None:
+            assert expected_output in result.stdout
+        assert len(client.calls_to(mocked_method)) == 1
+        assert len(client.calls_to("close")) == 1
+
+    def test_help(self, cli_runner, app):
+        """Test repos subcommand help end to end."""
+        result = cli_runner.invoke(app, ["repos", "list", "--help"])
         assert result.exit_code == 0
-        assert "Get repository information" in result.stdout
+        assert "List repositories" in result.stdout
 
-    def test_repos_info_invalid_format(self, runner):
-        """Test repos info with invalid repository format."""
-        result = runner.invoke(app, ["repos", "info", "invalid-repo-name"])
+    @pytest.mark.parametrize(
+        ("subcmd", "needle"),
+        [
+            ("list", "List repositories"),
+            ("info", "Get repository information"),
+            ("issues", "List repository issues"),
+            ("create", "Create a new repository"),
+            ("update", "Update repository settings"),
+            ("delete", "Delete a repository"),
+            ("fork", "Fork a repository"),
+        ],
+    )
+    def test_help_text(self, subcmd, needle):
+        """Test each repos subcommand's help text without rendering it."""
+        commands = {info.name: info for info in repos_app.registered_commands}
+        assert needle in commands[subcmd].callback.__doc__
+
+    @pytest.mark.parametrize("subcmd", ["info", "issues", "update", "delete", "fork"])
+    def test_invalid_repo_format(self, cli_runner, app, subcmd):
+        """Test repos subcommands with invalid repository format."""
+        result = cli_runner.invoke(app, ["repos", subcmd, "invalid-repo-name"])
         assert result.exit_code == 1
         assert "Repository name must be in 'owner/repo' format" in result.stdout
 
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
     @pytest.mark.api_mock
-    def test_repos_info_basic(self, mock_client_class, mock_config_manager, runner, mock_repo):
-        """Test basic repository info."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        mock_client.get_user_repos = AsyncMock(return_value=[mock_repo])
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
+    def test_repos_list_empty_result(self, script_client, cli_runner, app):
+        """Test repository listing with empty result."""
+        client = script_client(get_user_repos=[])
 
-        result = runner.invoke(app, ["repos", "info", "testuser/test-repo"])
+        result = cli_runner.invoke(app, ["repos", "list"])
 
         assert result.exit_code == 0
-        mock_client.get_user_repos.assert_called_once()
-        mock_client.close.assert_called_once()
+        assert "No repositories found" in result.stdout
+        assert len(client.calls_to("close")) == 1
 
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
     @pytest.mark.api_mock
-    def test_repos_info_not_found(self, mock_client_class, mock_config_manager, runner):
-        """Test repository info when repo not found."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        # Empty list = not found
-        mock_client.get_user_repos = AsyncMock(return_value=[])
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
-
-        result = runner.invoke(app, ["repos", "info", "testuser/nonexistent-repo"])
-
-        assert result.exit_code == 1
-        assert "Repository 'testuser/nonexistent-repo' not found" in result.stdout
-        mock_client.close.assert_called_once()
+    def test_repos_list_pagination(self, script_client, repo_pages):
+        """Test repository listing with pagination."""
+        client = script_client(get_user_repos=repo_pages)
 
-    def test_repos_issues_help(self, runner):
-        """Test repos issues command help."""
-        result = runner.invoke(app, ["repos", "issues", "--help"])
-        assert result.exit_code == 0
-        assert "List repository issues" in result.stdout
+        repos_list(username=None, repo_type="all", sort="updated", limit=150, format_type="table", output=None)
 
-    def test_repos_issues_invalid_format(self, runner):
-        """Test repos issues with invalid repository format."""
-        result = runner.invoke(app, ["repos", "issues", "invalid-repo-name"])
-        assert result.exit_code == 1
-        assert "Repository name must be in 'owner/repo' format" in result.stdout
+        assert [kwargs["page"] for _, kwargs in client.calls_to("get_user_repos")] == [1, 2]
+        assert len(client.calls_to("close")) == 1
 
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
     @pytest.mark.api_mock
-    def test_repos_issues_basic(self, mock_client_class, mock_config_manager, runner, mock_issue):
-        """Test basic repository issues listing."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        mock_client.get_repo_issues = AsyncMock(return_value=[mock_issue])
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
-
-        result = runner.invoke(app, ["repos", "issues", "testuser/test-repo"])
-
-        assert result.exit_code == 0
-        mock_client.get_repo_issues.assert_called_once()
-        mock_client.close.assert_called_once()
+    def test_repos_info_not_found(self, script_client, cli_runner, app):
+        """Test repository info when repo not found."""
+        # Empty list = not found
+        client = script_client(get_user_repos=[])
 
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
-    @pytest.mark.api_mock
-    def test_repos_issues_with_options(self, mock_client_class, mock_config_manager, runner, mock_issue):
-        """Test repository issues with various options."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        mock_client.get_repo_issues = AsyncMock(return_value=[mock_issue])
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
-
-        result = runner.invoke(
-            app,
-            [
-                "repos",
-                "issues",
-                "testuser/test-repo",
-                "--state",
-                "closed",
-                "--assignee",
-                "@me",
-                "--labels",
-                "bug,enhancement",
-                "--limit",
-                "50",
-                "--format",
-                "json",
-            ],
-        )
+        result = cli_runner.invoke(app, ["repos", "info", "testuser/nonexistent-repo"])
 
-        assert result.exit_code == 0
-        mock_client.get_repo_issues.assert_called_once()
-        mock_client.close.assert_called_once()
+        assert result.exit_code == 1
+        assert "Repository 'testuser/nonexistent-repo' not found" in result.stdout
+        assert len(client.calls_to("close")) == 1
 
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
     @pytest.mark.api_mock
-    def test_repos_issues_empty_result(self, mock_client_class, mock_config_manager, runner):
+    def test_repos_issues_empty_result(self, script_client, cli_runner, app):
         """Test repository issues with empty result."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        mock_client.get_repo_issues = AsyncMock(return_value=[])
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
+        client = script_client(get_repo_issues=[])
 
-        result = runner.invoke(app, ["repos", "issues", "testuser/test-repo"])
+        result = cli_runner.invoke(app, ["repos", "issues", "testuser/test-repo"])
 
         assert result.exit_code == 0
         assert "No issues found" in result.stdout
-        mock_client.close.assert_called_once()
+        assert len(client.calls_to("close")) == 1
 
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
     @pytest.mark.api_mock
-    def test_repos_issues_pagination(self, mock_client_class, mock_config_manager, runner, mock_issue):
+    def test_repos_issues_pagination(self, script_client, issue_pages):
         """Test repository issues with pagination."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        # Simulate pagination
-        mock_client.get_repo_issues = AsyncMock(
-            side_effect=[
-                [mock_issue] * 100,  # First page
-                [mock_issue] * 30,  # Second page (less than per_page)
-            ]
-        )
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
-
-        result = runner.invoke(app, ["repos", "issues", "testuser/test-repo", "--limit", "130"])
-
-        assert result.exit_code == 0
-        assert mock_client.get_repo_issues.call_count == 2
-        mock_client.close.assert_called_once()
-
-    def test_repos_create_help(self, runner):
-        """Test repos create command help."""
-        result = runner.invoke(app, ["repos", "create", "--help"])
-        assert result.exit_code == 0
-        assert "Create a new repository" in result.stdout
-
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
-    @pytest.mark.api_mock
-    def test_repos_create_basic(self, mock_client_class, mock_config_manager, runner, mock_repo):
-        """Test basic repository creation."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        mock_client.create_repo = AsyncMock(return_value=mock_repo)
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
-
-        result = runner.invoke(app, ["repos", "create", "new-repo"])
+        client = script_client(get_repo_issues=issue_pages)
 
-        assert result.exit_code == 0
-        assert "Repository 'testuser/test-repo' created successfully!" in result.stdout
-        mock_client.create_repo.assert_called_once()
-        mock_client.close.assert_called_once()
-
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
-    @pytest.mark.api_mock
-    def test_repos_create_with_options(self, mock_client_class, mock_config_manager, runner, mock_repo):
-        """Test repository creation with various options."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        mock_client.create_repo = AsyncMock(return_value=mock_repo)
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
-
-        result = runner.invoke(
-            app,
-            [
-                "repos",
-                "create",
-                "new-repo",
-                "--description",
-                "A new repository",
-                "--private",
-                "--no-issues",
-                "--no-wiki",
-                "--gitignore",
-                "Python",
-                "--license",
-                "MIT",
-            ],
+        repo_issues(
+            repo_name="testuser/test-repo",
+            state="open",
+            assignee=None,
+            labels=None,
+            limit=130,
+            format_type="table",
+            output=None,
         )
 
-        assert result.exit_code == 0
-        mock_client.create_repo.assert_called_once()
-        mock_client.close.assert_called_once()
+        assert [kwargs["page"] for _, kwargs in client.calls_to("get_repo_issues")] == [1, 2]
+        assert len(client.calls_to("close")) == 1
 
-    @patch("mygh.cli.repos.Prompt.ask")
-    @patch("mygh.cli.repos.Confirm.ask")
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
     @pytest.mark.api_mock
-    def test_repos_create_interactive(
-        self,
-        mock_client_class,
-        mock_config_manager,
-        mock_confirm,
-        mock_prompt,
-        runner,
-        mock_repo,
-    ):
+    def test_repos_create_interactive(self, script_client, prompts, cli_runner, app, mock_repo):
         """Test interactive repository creation."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        mock_client.create_repo = AsyncMock(return_value=mock_repo)
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
+        client = script_client(create_repo=mock_repo)
 
         # Mock interactive prompts
-        mock_prompt.side_effect = ["new-repo", "A new repo", "", ""]
+        prompts.prompt.side_effect = ["new-repo", "A new repo", "", ""]
         # private, issues, wiki, projects, auto_init
-        mock_confirm.side_effect = [False, True, True, True, True]
+        prompts.confirm.side_effect = [False, True, True, True, True]
 
-        result = runner.invoke(app, ["repos", "create", "initial-name", "--interactive"])
+        result = cli_runner.invoke(app, ["repos", "create", "initial-name", "--interactive"])
 
         assert result.exit_code == 0
-        mock_client.create_repo.assert_called_once()
-        mock_client.close.assert_called_once()
+        assert len(client.calls_to("create_repo")) == 1
+        assert len(client.calls_to("close")) == 1
 
-    def test_repos_update_help(self, runner):
-        """Test repos update command help."""
-        result = runner.invoke(app, ["repos", "update", "--help"])
-        assert result.exit_code == 0
-        assert "Update repository settings" in result.stdout
-
-    def test_repos_update_invalid_format(self, runner):
-        """Test repos update with invalid repository format."""
-        result = runner.invoke(app, ["repos", "update", "invalid-repo-name"])
-        assert result.exit_code == 1
-        assert "Repository name must be in 'owner/repo' format" in result.stdout
-
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
     @pytest.mark.api_mock
-    def test_repos_update_no_changes(self, mock_client_class, mock_config_manager, runner):
+    def test_repos_update_no_changes(self, patched_client, cli_runner, app):
         """Test repository update with no changes specified."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
-
-        result = runner.invoke(app, ["repos", "update", "testuser/test-repo"])
+        result = cli_runner.invoke(app, ["repos", "update", "testuser/test-repo"])
 
         assert result.exit_code == 0
         assert "No updates specified" in result.stdout
-        mock_client.close.assert_called_once()
-
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
-    @pytest.mark.api_mock
-    def test_repos_update_basic(self, mock_client_class, mock_config_manager, runner, mock_repo):
-        """Test basic repository update."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        mock_client.update_repo = AsyncMock(return_value=mock_repo)
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
-
-        result = runner.invoke(
-            app,
-            [
-                "repos",
-                "update",
-                "testuser/test-repo",
-                "--description",
-                "Updated description",
-            ],
-        )
-
-        assert result.exit_code == 0
-        assert "Repository 'testuser/test-repo' updated successfully!" in result.stdout
-        mock_client.update_repo.assert_called_once()
-        mock_client.close.assert_called_once()
+        assert len(patched_client.calls_to("close")) == 1
 
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
     @pytest.mark.api_mock
-    def test_repos_update_all_options(self, mock_client_class, mock_config_manager, runner, mock_repo):
-        """Test repository update with all options."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        mock_client.update_repo = AsyncMock(return_value=mock_repo)
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
-
-        result = runner.invoke(
-            app,
-            [
-                "repos",
-                "update",
-                "testuser/test-repo",
-                "--description",
-                "Updated description",
-                "--homepage",
-                "https://example.com",
-                "--private",
-                "--no-issues",
-                "--no-wiki",
-                "--no-projects",
-                "--no-squash",
-                "--no-merge",
-                "--no-rebase",
-                "--keep-branch",
-                "--archive",
-            ],
-        )
-
-        assert result.exit_code == 0
-        mock_client.update_repo.assert_called_once()
-        mock_client.close.assert_called_once()
-
-    def test_repos_delete_help(self, runner):
-        """Test repos delete command help."""
-        result = runner.invoke(app, ["repos", "delete", "--help"])
-        assert result.exit_code == 0
-        assert "Delete a repository" in result.stdout
-
-    def test_repos_delete_invalid_format(self, runner):
-        """Test repos delete with invalid repository format."""
-        result = runner.invoke(app, ["repos", "delete", "invalid-repo-name"])
-        assert result.exit_code == 1
-        assert "Repository name must be in 'owner/repo' format" in result.stdout
-
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
-    @pytest.mark.api_mock
-    def test_repos_delete_force(self, mock_client_class, mock_config_manager, runner):
+    def test_repos_delete_force(self, script_client, cli_runner, app):
         """Test repository deletion with force flag."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        mock_client.delete_repo = AsyncMock()
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
+        client = script_client(delete_repo=None)
 
-        result = runner.invoke(app, ["repos", "delete", "testuser/test-repo", "--force"])
+        result = cli_runner.invoke(app, ["repos", "delete", "testuser/test-repo", "--force"])
 
         assert result.exit_code == 0
         assert "Repository 'testuser/test-repo' deleted successfully" in result.stdout
-        mock_client.delete_repo.assert_called_once_with("testuser", "test-repo")
-        mock_client.close.assert_called_once()
+        assert client.calls_to("delete_repo") == [(("testuser", "test-repo"), {})]
+        assert len(client.calls_to("close")) == 1
 
-    @patch("mygh.cli.repos.Prompt.ask")
-    @patch("mygh.cli.repos.Confirm.ask")
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
     @pytest.mark.api_mock
-    def test_repos_delete_with_confirmation(
-        self,
-        mock_client_class,
-        mock_config_manager,
-        mock_confirm,
-        mock_prompt,
-        runner,
-    ):
+    def test_repos_delete_with_confirmation(self, script_client, prompts, cli_runner, app):
         """Test repository deletion with confirmation."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        mock_client.delete_repo = AsyncMock()
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
+        client = script_client(delete_repo=None)
 
         # Mock confirmation prompts
-        mock_confirm.return_value = True
-        mock_prompt.return_value = "testuser/test-repo"
+        prompts.confirm.return_value = True
+        prompts.prompt.return_value = "testuser/test-repo"
 
-        result = runner.invoke(app, ["repos", "delete", "testuser/test-repo"])
+        result = cli_runner.invoke(app, ["repos", "delete", "testuser/test-repo"])
 
         assert result.exit_code == 0
         assert "Repository 'testuser/test-repo' deleted successfully" in result.stdout
-        mock_client.delete_repo.assert_called_once_with("testuser", "test-repo")
-        mock_client.close.assert_called_once()
+        assert client.calls_to("delete_repo") == [(("testuser", "test-repo"), {})]
+        assert len(client.calls_to("close")) == 1
 
-    @patch("mygh.cli.repos.Confirm.ask")
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
     @pytest.mark.api_mock
-    def test_repos_delete_cancelled(self, mock_client_class, mock_config_manager, mock_confirm, runner):
+    def test_repos_delete_cancelled(self, patched_client, prompts, cli_runner, app):
         """Test repository deletion cancelled by user."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
-
         # Mock confirmation prompts - user cancels
-        mock_confirm.return_value = False
+        prompts.confirm.return_value = False
 
-        result = runner.invoke(app, ["repos", "delete", "testuser/test-repo"])
+        result = cli_runner.invoke(app, ["repos", "delete", "testuser/test-repo"])
 
         assert result.exit_code == 0
         assert "Repository deletion cancelled" in result.stdout
-        # Note: client.close() is not called when user cancels before creating
-        # client
+        # The client is never used when the user cancels before it is needed
+        assert patched_client.calls == []
 
-    @patch("mygh.cli.repos.Prompt.ask")
-    @patch("mygh.cli.repos.Confirm.ask")
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
     @pytest.mark.api_mock
-    def test_repos_delete_wrong_confirmation(
-        self,
-        mock_client_class,
-        mock_config_manager,
-        mock_confirm,
-        mock_prompt,
-        runner,
-    ):
+    def test_repos_delete_wrong_confirmation(self, patched_client, prompts, cli_runner, app):
         """Test repository deletion with wrong confirmation text."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
-
         # Mock confirmation prompts
-        mock_confirm.return_value = True
-        mock_prompt.return_value = "wrong-repo-name"  # Wrong confirmation
+        prompts.confirm.return_value = True
+        prompts.prompt.return_value = "wrong-repo-name"  # Wrong confirmation
 
-        result = runner.invoke(app, ["repos", "delete", "testuser/test-repo"])
+        result = cli_runner.invoke(app, ["repos", "delete", "testuser/test-repo"])
 
         assert result.exit_code == 0
         assert "Repository name doesn't match. Deletion cancelled." in result.stdout
-        # Note: client.close() is not called when user provides wrong
-        # confirmation
-
-    def test_repos_fork_help(self, runner):
-        """Test repos fork command help."""
-        result = runner.invoke(app, ["repos", "fork", "--help"])
-        assert result.exit_code == 0
-        assert "Fork a repository" in result.stdout
-
-    def test_repos_fork_invalid_format(self, runner):
-        """Test repos fork with invalid repository format."""
-        result = runner.invoke(app, ["repos", "fork", "invalid-repo-name"])
-        assert result.exit_code == 1
-        assert "Repository name must be in 'owner/repo' format" in result.stdout
-
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
-    @pytest.mark.api_mock
-    def test_repos_fork_basic(self, mock_client_class, mock_config_manager, runner, mock_repo):
-        """Test basic repository forking."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        mock_client.fork_repo = AsyncMock(return_value=mock_repo)
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
-
-        result = runner.invoke(app, ["repos", "fork", "testuser/test-repo"])
-
-        assert result.exit_code == 0
-        assert "Repository 'testuser/test-repo' forked successfully!" in result.stdout
-        mock_client.fork_repo.assert_called_once()
-        mock_client.close.assert_called_once()
-
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
-    @pytest.mark.api_mock
-    def test_repos_fork_to_organization(self, mock_client_class, mock_config_manager, runner, mock_repo):
-        """Test repository forking to organization."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        mock_client.fork_repo = AsyncMock(return_value=mock_repo)
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
-
-        result = runner.invoke(app, ["repos", "fork", "testuser/test-repo", "--org", "myorg"])
-
-        assert result.exit_code == 0
-        mock_client.fork_repo.assert_called_once()
-        mock_client.close.assert_called_once()
+        # The client is never used when the confirmation text is wrong
+        assert patched_client.calls == []
 
 
 class TestReposExceptionHandling:
     """Test exception handling in repos commands."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create a CLI runner."""
-        return CliRunner()
-
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
-    @pytest.mark.api_mock
-    def test_authentication_error_handling(self, mock_client_class, mock_config_manager, runner):
-        """Test handling of authentication errors."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        mock_client.get_user_repos = AsyncMock(side_effect=AuthenticationError("Invalid token"))
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
-
-        result = runner.invoke(app, ["repos", "list"])
-
-        assert result.exit_code == 1
-        assert "Authentication error" in result.stdout
-        assert "To authenticate:" in result.stdout
-
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
     @pytest.mark.api_mock
-    def test_api_error_handling(self, mock_client_class, mock_config_manager, runner):
-        """Test handling of API errors."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        mock_client.get_user_repos = AsyncMock(side_effect=APIError("API rate limit exceeded"))
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
-
-        result = runner.invoke(app, ["repos", "list"])
-
-        assert result.exit_code == 1
-        assert "API error" in result.stdout
-
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
-    @pytest.mark.api_mock
-    def test_mygh_exception_handling(self, mock_client_class, mock_config_manager, runner):
-        """Test handling of MyGH exceptions."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        mock_client.get_user_repos = AsyncMock(side_effect=MyGHException("Custom error"))
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
-
-        result = runner.invoke(app, ["repos", "list"])
-
-        assert result.exit_code == 1
-        assert "Error:" in result.stdout
-
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
-    @pytest.mark.api_mock
-    def test_keyboard_interrupt_handling(self, mock_client_class, mock_config_manager, runner):
-        """Test handling of keyboard interrupts."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        mock_client.get_user_repos = AsyncMock(side_effect=KeyboardInterrupt())
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
-
-        result = runner.invoke(app, ["repos", "list"])
-
-        assert result.exit_code == 0
-        assert "Operation cancelled" in result.stdout
-
-    @patch("mygh.cli.repos.config_manager")
-    @patch("mygh.cli.repos.GitHubClient")
-    @pytest.mark.api_mock
-    def test_unexpected_exception_handling(self, mock_client_class, mock_config_manager, runner):
-        """Test handling of unexpected exceptions."""
-        # Setup mocks
-        mock_config = Mock()
-        mock_config.github_token = "fake_token"
-        mock_config_manager.get_config.return_value = mock_config
-
-        mock_client = AsyncMock()
-        mock_client.get_user_repos = AsyncMock(side_effect=ValueError("Unexpected error"))
-        mock_client.close = AsyncMock()
-        mock_client_class.return_value = mock_client
-
-        result = runner.invoke(app, ["repos", "list"])
-
-        assert result.exit_code == 1
-        assert "Unexpected error" in result.stdout
+    @pytest.mark.parametrize(
+        ("error", "exit_code", "expected_output"),
+        [
+            pytest.param(
+                AuthenticationError("Invalid token"),
+                1,
+                ["Authentication error", "To authenticate:"],
+                id="authentication-error",
+            ),
+            pytest.param(APIError("API rate limit exceeded"), 1, ["API error"], id="api-error"),
+            pytest.param(MyGHException("Custom error"), 1, ["Error:"], id="mygh-exception"),
+            pytest.param(KeyboardInterrupt(), 0, ["Operation cancelled"], id="keyboard-interrupt"),
+            pytest.param(ValueError("Unexpected error"), 1, ["Unexpected error"], id="unexpected-exception"),
+        ],
+    )
+    def test_exception_handling(self, script_client, cli_runner, app, error, exit_code, expected_output):
+        """Test that client errors are reported with the right exit code."""
+        script_client(get_user_repos=error)
+
+        result = cli_runner.invoke(app, ["repos", "list"])
+
+        assert result.exit_code == exit_code
+        for text in expected_output:
+            assert text in result.stdout
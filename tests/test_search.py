@@ -1,513 +1,192 @@
 """Tests for the search CLI commands."""
 
 import asyncio
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
-from typer.testing import CliRunner
+import typer
 
-from mygh.cli.main import app
 
+@pytest.fixture(scope="module")
+def search_command(app):
+    """Click group behind ``mygh search``, built once for the module."""
+    return typer.main.get_command(app).commands["search"]
 
-def create_safe_asyncio_run_mock():
-    """Create a safe mock for asyncio.run that properly closes coroutines."""
 
-    def close_coroutine(coro):
-        if asyncio.iscoroutine(coro):
-            coro.close()
-        return None
+def invoke_search(search_command, args):
+    """Parse ``args`` for a search subcommand and run its callback in-process.
 
-    mock = MagicMock(side_effect=close_coroutine)
-    return mock
+    Skips ``CliRunner`` isolation for cases that only need argument parsing to
+    reach the (mocked) dispatcher; parse errors and exits propagate as raised.
+    """
+    command = search_command.commands[args[0]]
+    with command.make_context(args[0], list(args[1:])) as ctx:
+        command.invoke(ctx)
+
+
+def _close_coro(coro):
+    """Close a coroutine handed to the mocked dispatcher instead of running it."""
+    if asyncio.iscoroutine(coro):
+        coro.close()
 
 
 class TestSearchCLI:
     """Test the search CLI commands."""
 
     @pytest.fixture(autouse=True)
-    def setup_coroutine_cleanup(self):
-        """Automatically cleanup coroutines for all tests."""
-        # This fixture runs for all tests in this class to ensure
-        # proper coroutine cleanup and avoid RuntimeWarnings
-        pass
-
-    def test_search_help(self):
-        """Test search command help."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "--help"])
-        assert result.exit_code == 0
-        assert "Advanced search capabilities" in result.stdout
-
-    def test_search_repos_help(self):
-        """Test search repos command help."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "repos", "--help"])
-        assert result.exit_code == 0
-        assert "Search repositories" in result.stdout
-
-    def test_search_users_help(self):
-        """Test search users command help."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "users", "--help"])
-        assert result.exit_code == 0
-        assert "Search users" in result.stdout
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_repos_basic(self, mock_asyncio_run):
-        """Test basic repository search."""
-        mock_asyncio_run.side_effect = create_safe_asyncio_run_mock().side_effect
-
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "repos", "python"])
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_repos_with_sort(self, mock_asyncio_run):
-        """Test repository search with sort option."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "repos", "python", "--sort", "stars"])
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_repos_with_order(self, mock_asyncio_run):
-        """Test repository search with order option."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "repos", "python", "--order", "asc"])
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_repos_with_limit(self, mock_asyncio_run):
-        """Test repository search with limit option."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "repos", "python", "--limit", "10"])
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_repos_all_sort_options(self, mock_asyncio_run):
-        """Test repository search with all valid sort options."""
-        import asyncio
-
-        # Configure mock to close coroutines properly to avoid unawaited warnings
-        def close_coroutine(coro):
-            if asyncio.iscoroutine(coro):
-                coro.close()
-            return None
-
-        mock_asyncio_run.side_effect = close_coroutine
-
-        sort_options = ["stars", "forks", "help-wanted-issues", "updated"]
-
-        for sort_option in sort_options:
-            runner = CliRunner()
-            result = runner.invoke(app, ["search", "repos", "python", "--sort", sort_option])
-
-            assert result.exit_code == 0
-
-        assert mock_asyncio_run.call_count == len(sort_options)
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_repos_all_order_options(self, mock_asyncio_run):
-        """Test repository search with all valid order options."""
-        import asyncio
-
-        # Configure mock to close coroutines properly to avoid unawaited warnings
-        def close_coroutine(coro):
-            if asyncio.iscoroutine(coro):
-                coro.close()
-            return None
-
-        mock_asyncio_run.side_effect = close_coroutine
-
-        order_options = ["asc", "desc"]
-
-        for order_option in order_options:
-            runner = CliRunner()
-            result = runner.invoke(app, ["search", "repos", "python", "--order", order_option])
-
-            assert result.exit_code == 0
-
-        assert mock_asyncio_run.call_count == len(order_options)
+    def mock_run(self):
+        """Patch the search dispatcher so commands never reach the network.
 
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_repos_with_format_json(self, mock_asyncio_run):
-        """Test repository search with JSON format."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "repos", "python", "--format", "json"])
+        The mock closes the coroutine it receives to avoid "never awaited"
+        RuntimeWarnings.
+        """
+        with patch("mygh.cli.search._run", side_effect=_close_coro) as mock:
+            yield mock
 
+    def test_search_help(self, cli_runner, app):
+        """Test search command help end to end."""
+        result = cli_runner.invoke(app, ["search", "--help"])
         assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_repos_with_output_file(self, mock_asyncio_run):
-        """Test repository search with output file."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "repos", "python", "--output", "repos.json"])
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_repos_all_options(self, mock_asyncio_run):
-        """Test repository search with all options."""
-        runner = CliRunner()
-        result = runner.invoke(
-            app,
-            [
-                "search",
-                "repos",
-                "python",
-                "--sort",
-                "stars",
-                "--order",
-                "desc",
-                "--limit",
-                "5",
-                "--format",
-                "json",
-                "--output",
-                "search_results.json",
-            ],
-        )
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_users_basic(self, mock_asyncio_run):
-        """Test basic user search."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "users", "john"])
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_users_with_sort(self, mock_asyncio_run):
-        """Test user search with sort option."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "users", "john", "--sort", "followers"])
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_users_with_order(self, mock_asyncio_run):
-        """Test user search with order option."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "users", "john", "--order", "asc"])
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_users_with_limit(self, mock_asyncio_run):
-        """Test user search with limit option."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "users", "john", "--limit", "15"])
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_users_all_sort_options(self, mock_asyncio_run):
-        """Test user search with all valid sort options."""
-        import asyncio
-
-        # Configure mock to close coroutines properly to avoid unawaited warnings
-        def close_coroutine(coro):
-            if asyncio.iscoroutine(coro):
-                coro.close()
-            return None
-
-        mock_asyncio_run.side_effect = close_coroutine
-
-        sort_options = ["followers", "repositories", "joined"]
-
-        for sort_option in sort_options:
-            runner = CliRunner()
-            result = runner.invoke(app, ["search", "users", "john", "--sort", sort_option])
-
-            assert result.exit_code == 0
-
-        assert mock_asyncio_run.call_count == len(sort_options)
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_users_all_order_options(self, mock_asyncio_run):
-        """Test user search with all valid order options."""
-        import asyncio
-
-        # Configure mock to close coroutines properly to avoid unawaited warnings
-        def close_coroutine(coro):
-            if asyncio.iscoroutine(coro):
-                coro.close()
-            return None
-
-        mock_asyncio_run.side_effect = close_coroutine
-
-        order_options = ["asc", "desc"]
-
-        for order_option in order_options:
-            runner = CliRunner()
-            result = runner.invoke(app, ["search", "users", "john", "--order", order_option])
-
-            assert result.exit_code == 0
-
-        assert mock_asyncio_run.call_count == len(order_options)
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_users_with_format_json(self, mock_asyncio_run):
-        """Test user search with JSON format."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "users", "john", "--format", "json"])
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_users_with_output_file(self, mock_asyncio_run):
-        """Test user search with output file."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "users", "john", "--output", "users.json"])
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_users_all_options(self, mock_asyncio_run):
-        """Test user search with all options."""
-        runner = CliRunner()
-        result = runner.invoke(
-            app,
-            [
-                "search",
-                "users",
-                "john",
-                "--sort",
-                "followers",
-                "--order",
-                "desc",
-                "--limit",
-                "8",
-                "--format",
-                "json",
-                "--output",
-                "user_search.json",
-            ],
-        )
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    def test_search_repos_invalid_sort(self):
-        """Test repository search with invalid sort option."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "repos", "python", "--sort", "invalid"])
-
-        # Should exit with error due to invalid choice
-        assert result.exit_code != 0
-
-    def test_search_users_invalid_sort(self):
-        """Test user search with invalid sort option."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "users", "john", "--sort", "invalid"])
-
-        # Should exit with error due to invalid choice
-        assert result.exit_code != 0
-
-    def test_search_repos_invalid_order(self):
-        """Test repository search with invalid order option."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "repos", "python", "--order", "invalid"])
-
-        # Should exit with error due to invalid choice
-        assert result.exit_code != 0
-
-    def test_search_users_invalid_order(self):
-        """Test user search with invalid order option."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "users", "john", "--order", "invalid"])
-
-        # Should exit with error due to invalid choice
-        assert result.exit_code != 0
-
-    def test_search_repos_invalid_format(self):
-        """Test repository search with invalid format option."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "repos", "python", "--format", "invalid"])
-
-        # Should exit with error due to invalid choice
-        assert result.exit_code != 0
-
-    def test_search_users_invalid_format(self):
-        """Test user search with invalid format option."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "users", "john", "--format", "invalid"])
-
-        # Should exit with error due to invalid choice
-        assert result.exit_code != 0
-
-    def test_search_repos_negative_limit(self):
-        """Test repository search with negative limit."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "repos", "python", "--limit", "-1"])
-
-        # Should exit with error due to invalid value
-        assert result.exit_code != 0
-
-    def test_search_users_negative_limit(self):
-        """Test user search with negative limit."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "users", "john", "--limit", "-1"])
-
-        # Should exit with error due to invalid value
-        assert result.exit_code != 0
-
-    def test_search_repos_zero_limit(self):
-        """Test repository search with zero limit."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "repos", "python", "--limit", "0"])
-
-        # Should exit with error due to invalid value
-        assert result.exit_code != 0
+        assert "Advanced search capabilities" in result.stdout
 
-    def test_search_users_zero_limit(self):
-        """Test user search with zero limit."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "users", "john", "--limit", "0"])
+    @pytest.mark.parametrize(
+        ("subcmd", "needle"),
+        [
+            ("repos", "Search repositories"),
+            ("users", "Search users"),
+        ],
+    )
+    def test_search_subcommand_help(self, search_command, subcmd, needle):
+        """Test search subcommand help text without rendering it."""
+        assert needle in search_command.commands[subcmd].help
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            pytest.param(["repos", "python"], id="repos-basic"),
+            pytest.param(["repos", "python", "--sort", "stars"], id="repos-sort"),
+            pytest.param(["repos", "python", "--order", "asc"], id="repos-order"),
+            pytest.param(["repos", "python", "--limit", "10"], id="repos-limit"),
+            pytest.param(["repos", "python", "--format", "json"], id="repos-format-json"),
+            pytest.param(["repos", "python", "--output", "repos.json"], id="repos-output-file"),
+            pytest.param(
+                [
+                    "repos",
+                    "python",
+                    "--sort",
+                    "stars",
+                    "--order",
+                    "desc",
+                    "--limit",
+                    "5",
+                    "--format",
+                    "json",
+                    "--output",
+                    "search_results.json",
+                ],
+                id="repos-all-options",
+            ),
+            pytest.param(["users", "john"], id="users-basic"),
+            pytest.param(["users", "john", "--sort", "followers"], id="users-sort"),
+            pytest.param(["users", "john", "--order", "asc"], id="users-order"),
+            pytest.param(["users", "john", "--limit", "15"], id="users-limit"),
+            pytest.param(["users", "john", "--format", "json"], id="users-format-json"),
+            pytest.param(["users", "john", "--output", "users.json"], id="users-output-file"),
+            pytest.param(
+                [
+                    "users",
+                    "john",
+                    "--sort",
+                    "followers",
+                    "--order",
+                    "desc",
+                    "--limit",
+                    "8",
+                    "--format",
+                    "json",
+                    "--output",
+                    "user_search.json",
+                ],
+                id="users-all-options",
+            ),
+            pytest.param(["repos", "language:python stars:>1000"], id="repos-complex-query"),
+            pytest.param(["users", "location:London followers:>100"], id="users-complex-query"),
+            pytest.param(["repos", ""], id="repos-empty-query"),
+            pytest.param(["users", ""], id="users-empty-query"),
+            pytest.param(["repos", '"machine learning"'], id="repos-quoted-query"),
+            pytest.param(["users", '"John Smith"'], id="users-quoted-query"),
+            pytest.param(["repos", "python", "--limit", "1000"], id="repos-large-limit"),
+            pytest.param(["users", "john", "--limit", "1000"], id="users-large-limit"),
+            pytest.param(["repos", "test+repo-name_with.special"], id="special-characters-query"),
+            pytest.param(["repos", "pythön"], id="unicode-query"),
+        ],
+    )
+    def test_search_invoke_ok(self, mock_run, search_command, argv):
+        """Test that valid search invocations dispatch the search coroutine."""
+        invoke_search(search_command, argv)
+
+        assert mock_run.call_count == 1
+
+    @pytest.mark.parametrize(
+        ("subcmd", "sort_option"),
+        [
+            *[("repos", sort) for sort in ("stars", "forks", "help-wanted-issues", "updated")],
+            *[("users", sort) for sort in ("followers", "repositories", "joined")],
+        ],
+    )
+    def test_search_sort_options(self, mock_run, search_command, subcmd, sort_option):
+        """Test repository and user search with each valid sort option."""
+        invoke_search(search_command, [subcmd, "python", "--sort", sort_option])
+
+        assert mock_run.call_count == 1
+
+    @pytest.mark.parametrize("subcmd", ["repos", "users"])
+    @pytest.mark.parametrize("order_option", ["asc", "desc"])
+    def test_search_order_options(self, mock_run, search_command, subcmd, order_option):
+        """Test repository and user search with each valid order option."""
+        invoke_search(search_command, [subcmd, "python", "--order", order_option])
+
+        assert mock_run.call_count == 1
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            pytest.param(["repos", "python", "--sort", "invalid"], id="repos-invalid-sort"),
+            pytest.param(["users", "john", "--sort", "invalid"], id="users-invalid-sort"),
+            pytest.param(["repos", "python", "--order", "invalid"], id="repos-invalid-order"),
+            pytest.param(["users", "john", "--order", "invalid"], id="users-invalid-order"),
+        ],
+    )
+    def test_search_invalid_choice(self, mock_run, search_command, args):
+        """Test that an unknown --sort or --order value exits before any search runs."""
+        with pytest.raises(typer.Exit) as exc_info:
+            invoke_search(search_command, args)
+
+        assert exc_info.value.exit_code == 1
+        mock_run.assert_not_called()
+
+    @pytest.mark.parametrize("subcmd", ["repos", "users"])
+    @pytest.mark.parametrize("bad_limit", ["-1", "0"])
+    def test_search_invalid_limit(self, search_command, subcmd, bad_limit):
+        """Test that --limit rejects values below one."""
+        param = next(p for p in search_command.commands[subcmd].params if p.name == "limit")
+
+        with pytest.raises(typer.BadParameter):
+            param.type.convert(bad_limit, param, None)
+
+    @pytest.mark.parametrize("subcmd", ["repos", "users"])
+    def test_search_invalid_format(self, mock_run, cli_runner, app, subcmd):
+        """Test that an unknown output format exits with an error."""
+        # --format is validated inside the search coroutine, so let it run
+        mock_run.side_effect = asyncio.run
+
+        result = cli_runner.invoke(app, ["search", subcmd, "python", "--format", "invalid"])
 
-        # Should exit with error due to invalid value
         assert result.exit_code != 0
 
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_complex_query_repos(self, mock_asyncio_run):
-        """Test repository search with complex query."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "repos", "language:python stars:>1000"])
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_complex_query_users(self, mock_asyncio_run):
-        """Test user search with complex query."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "users", "location:London followers:>100"])
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_empty_query_repos(self, mock_asyncio_run):
-        """Test repository search with empty query."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "repos", ""])
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_empty_query_users(self, mock_asyncio_run):
-        """Test user search with empty query."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "users", ""])
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_quoted_query_repos(self, mock_asyncio_run):
-        """Test repository search with quoted query."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "repos", '"machine learning"'])
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_quoted_query_users(self, mock_asyncio_run):
-        """Test user search with quoted query."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "users", '"John Smith"'])
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_large_limit_repos(self, mock_asyncio_run):
-        """Test repository search with large limit."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "repos", "python", "--limit", "1000"])
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_large_limit_users(self, mock_asyncio_run):
-        """Test user search with large limit."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "users", "john", "--limit", "1000"])
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_special_characters_query(self, mock_asyncio_run):
-        """Test search with special characters in query."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "repos", "test+repo-name_with.special"])
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    @patch("mygh.cli.search.asyncio.run")
-    def test_search_unicode_query(self, mock_asyncio_run):
-        """Test search with unicode characters in query."""
-        runner = CliRunner()
-        result = runner.invoke(app, ["search", "repos", "pythön"])
-
-        assert result.exit_code == 0
-        mock_asyncio_run.assert_called_once()
-
-    def test_help_text_completeness_repos(self):
-        """Test that repos search help text contains useful information."""
-        import re
-
-        runner = CliRunner(env={"NO_COLOR": "1"})
-        result = runner.invoke(app, ["search", "repos", "--help"])
-
-        assert result.exit_code == 0
-        # Strip ANSI escape codes for robust testing
-        ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-        clean_text = ansi_escape.sub("", result.stdout)
-
-        assert "--sort" in clean_text
-        assert "--order" in clean_text
-        assert "--limit" in clean_text
-        assert "--format" in clean_text
-        assert "--output" in clean_text
-
-    def test_help_text_completeness_users(self):
-        """Test that users search help text contains useful information."""
-        import re
-
-        runner = CliRunner(env={"NO_COLOR": "1"})
-        result = runner.invoke(app, ["search", "users", "--help"])
-
-        assert result.exit_code == 0
-        # Strip ANSI escape codes for robust testing
-        ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-        clean_text = ansi_escape.sub("", result.stdout)
+    @pytest.mark.parametrize("subcmd", ["repos", "users"])
+    def test_help_text_completeness(self, search_command, subcmd):
+        """Test that search subcommands document all of their options."""
+        opts = {opt for param in search_command.commands[subcmd].params for opt in param.opts}
 
-        assert "--sort" in clean_text
-        assert "--order" in clean_text
-        assert "--limit" in clean_text
-        assert "--format" in clean_text
-        assert "--output" in clean_text
+        assert {"--sort", "--order", "--limit", "--format", "--output"} <= opts
@@ -1,125 +1,148 @@
 """Tests for actual search command execution to improve coverage."""
 
-import tempfile
-from unittest.mock import AsyncMock, patch
+import json
+from unittest.mock import patch
 
-import httpx
 import pytest
 import respx
-from typer.testing import CliRunner
+import typer
 
-from mygh.cli.search import search_app
+from mygh.cli.search import handle_exceptions, search_app, validate_order, validate_repo_sort, validate_user_sort
 from mygh.exceptions import APIError, AuthenticationError, MyGHException
 
+from ._stubs import StubGitHubClient
 
-class TestSearchExecution:
-    """Test actual search command execution for coverage."""
-
-    @pytest.fixture
-    def runner(self):
-        """Create CLI runner."""
-        return CliRunner()
 
-    @pytest.fixture
-    def sample_repo_data(self):
-        """Sample repository data."""
-        return {
-            "id": 1,
-            "node_id": "MDEwOlJlcG9zaXRvcnkx",
-            "name": "test-repo",
-            "full_name": "owner/test-repo",
-            "private": False,
-            "owner": {
-                "login": "owner",
-                "id": 1,
-                "node_id": "MDQ6VXNlcjE=",
-                "avatar_url": "https://github.com/images/error/owner_happy.gif",
-                "gravatar_id": "",
-                "url": "https://api.github.com/users/owner",
-                "html_url": "https://github.com/owner",
-                "followers_url": "https://api.github.com/users/owner/followers",
-                "following_url": "https://api.github.com/users/owner/following{/other_user}",
-                "gists_url": "https://api.github.com/users/owner/gists{/gist_id}",
-                "starred_url": "https://api.github.com/users/owner/starred{/owner}{/repo}",
-                "subscriptions_url": "https://api.github.com/users/owner/subscriptions",
-                "organizations_url": "https://api.github.com/users/owner/orgs",
-                "repos_url": "https://api.github.com/users/owner/repos",
-                "events_url": "https://api.github.com/users/owner/events{/privacy}",
-                "received_events_url": "https://api.github.com/users/owner/received_events",
-                "type": "User",
-                "site_admin": False,
-            },
-            "html_url": "https://github.com/owner/test-repo",
-            "description": "Test repository",
-            "fork": False,
-            "url": "https://api.github.com/repos/owner/test-repo",
-            "created_at": "2023-01-01T00:00:00Z",
-            "updated_at": "2023-06-01T00:00:00Z",
-            "pushed_at": "2023-06-01T00:00:00Z",
-            "clone_url": "https://github.com/owner/test-repo.git",
-            "ssh_url": "git@github.com:owner/test-repo.git",
-            "size": 100,
-            "stargazers_count": 5,
-            "watchers_count": 3,
-            "language": "Python",
-            "has_issues": True,
-            "has_projects": True,
-            "has_wiki": True,
-            "has_pages": False,
-            "has_downloads": True,
-            "archived": False,
-            "disabled": False,
-            "open_issues_count": 2,
-            "license": None,
-            "forks_count": 1,
-            "open_issues": 2,
-            "watchers": 3,
-            "default_branch": "main",
-            "topics": ["python", "testing"],
-        }
-
-    @pytest.fixture
-    def sample_user_data(self):
-        """Sample user data."""
-        return {
-            "login": "testuser",
+@pytest.fixture(scope="session")
+def sample_repo_data():
+    """Repository item returned by the mocked search API (read-only)."""
+    return {
+        "id": 1,
+        "node_id": "MDEwOlJlcG9zaXRvcnkx",
+        "name": "test-repo",
+        "full_name": "owner/test-repo",
+        "private": False,
+        "owner": {
+            "login": "owner",
             "id": 1,
             "node_id": "MDQ6VXNlcjE=",
-            "avatar_url": "https://github.com/images/error/testuser_happy.gif",
+            "avatar_url": "https://github.com/images/error/owner_happy.gif",
             "gravatar_id": "",
-            "url": "https://api.github.com/users/testuser",
-            "html_url": "https://github.com/testuser",
-            "followers_url": "https://api.github.com/users/testuser/followers",
-            "following_url": "https://api.github.com/users/testuser/following{/other_user}",
-            "gists_url": "https://api.github.com/users/testuser/gists{/gist_id}",
-            "starred_url": "https://api.github.com/users/testuser/starred{/owner}{/repo}",
-            "subscriptions_url": "https://api.github.com/users/testuser/subscriptions",
-            "organizations_url": "https://api.github.com/users/testuser/orgs",
-            "repos_url": "https://api.github.com/users/testuser/repos",
-            "events_url": "https://api.github.com/users/testuser/events{/privacy}",
-            "received_events_url": "https://api.github.com/users/testuser/received_events",
+            "url": "https://api.github.com/users/owner",
+            "html_url": "https://github.com/owner",
+            "followers_url": "https://api.github.com/users/owner/followers",
+            "following_url": "https://api.github.com/users/owner/following{/other_user}",
+            "gists_url": "https://api.github.com/users/owner/gists{/gist_id}",
+            "starred_url": "https://api.github.com/users/owner/starred{/owner}{/repo}",
+            "subscriptions_url": "https://api.github.com/users/owner/subscriptions",
+            "organizations_url": "https://api.github.com/users/owner/orgs",
+            "repos_url": "https://api.github.com/users/owner/repos",
+            "events_url": "https://api.github.com/users/owner/events{/privacy}",
+            "received_events_url": "https://api.github.com/users/owner/received_events",
             "type": "User",
             "site_admin": False,
-            "name": "Test User",
-            "company": "Test Company",
-            "location": "Test Location",
-            "followers": 10,
-            "public_repos": 5,
-        }
-
-    @respx.mock
-    def test_search_repos_table_execution(self, runner, sample_repo_data):
-        """Test actual execution of repos search with table output."""
-        search_data = {
-            "total_count": 1,
-            "incomplete_results": False,
-            "items": [sample_repo_data],
-        }
+        },
+        "html_url": "https://github.com/owner/test-repo",
+        "description": "Test repository",
+        "fork": False,
+        "url": "https://api.github.com/repos/owner/test-repo",
+        "created_at": "2023-01-01T00:00:00Z",
+        "updated_at": "2023-06-01T00:00:00Z",
+        "pushed_at": "2023-06-01T00:00:00Z",
+        "clone_url": "https://github.com/owner/test-repo.git",
+        "ssh_url": "git@github.com:owner/test-repo.git",
+        "size": 100,
+        "stargazers_count": 5,
+        "watchers_count": 3,
+        "language": "Python",
+        "has_issues": True,
+        "has_projects": True,
+        "has_wiki": True,
+        "has_pages": False,
+        "has_downloads": True,
+        "archived": False,
+        "disabled": False,
+        "open_issues_count": 2,
+        "license": None,
+        "forks_count": 1,
+        "open_issues": 2,
+        "watchers": 3,
+        "default_branch": "main",
+        "topics": ["python", "testing"],
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_user_data():
+    """User item returned by the mocked search API (read-only)."""
+    return {
+        "login": "testuser",
+        "id": 1,
+        "node_id": "MDQ6VXNlcjE=",
+        "avatar_url": "https://github.com/images/error/testuser_happy.gif",
+        "gravatar_id": "",
+        "url": "https://api.github.com/users/testuser",
+        "html_url": "https://github.com/testuser",
+        "followers_url": "https://api.github.com/users/testuser/followers",
+        "following_url": "https://api.github.com/users/testuser/following{/other_user}",
+        "gists_url": "https://api.github.com/users/testuser/gists{/gist_id}",
+        "starred_url": "https://api.github.com/users/testuser/starred{/owner}{/repo}",
+        "subscriptions_url": "https://api.github.com/users/testuser/subscriptions",
+        "organizations_url": "https://api.github.com/users/testuser/orgs",
+        "repos_url": "https://api.github.com/users/testuser/repos",
+        "events_url": "https://api.github.com/users/testuser/events{/privacy}",
+        "received_events_url": "https://api.github.com/users/testuser/received_events",
+        "type": "User",
+        "site_admin": False,
+        "name": "Test User",
+        "company": "Test Company",
+        "location": "Test Location",
+        "followers": 10,
+        "public_repos": 5,
+    }
+
+
+@pytest.fixture(scope="session")
+def repo_search_data(sample_repo_data):
+    """Repository search response wrapping ``sample_repo_data``."""
+    return {"total_count": 1, "incomplete_results": False, "items": [sample_repo_data]}
+
+
+@pytest.fixture(scope="session")
+def user_search_data(sample_user_data):
+    """User search response wrapping ``sample_user_data``."""
+    return {"total_count": 1, "incomplete_results": False, "items": [sample_user_data]}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def github_token():
+    """Provide a GitHub token to every search invocation in this module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("GITHUB_TOKEN", "test_token")
+        yield "test_token"
+
+
+@pytest.fixture(scope="module")
+def gh_mock():
+    """Module-wide respx router with the two search endpoints pre-registered.
+
+    Tests set the response for the route they exercise, e.g.
+    ``gh_mock["repos"].respond(200, json=...)``.
+    """
+    with respx.mock(base_url="https://api.github.com", assert_all_called=False) as router:
+        router.get("/search/repositories", name="repos")
+        router.get("/search/users", name="users")
+        yield router
 
-        respx.get("https://api.github.com/search/repositories").mock(return_value=httpx.Response(200, json=search_data))
 
-        with patch.dict("os.environ", {"GITHUB_TOKEN": "test_token"}):
-            result = runner.invoke(search_app, ["repos", "python", "--format", "table"])
+class TestSearchExecution:
+    """Test actual search command execution for coverage."""
+
+    def test_search_repos_table_execution(self, cli_runner, gh_mock, repo_search_data):
+        """Test actual execution of repos search with table output."""
+        gh_mock["repos"].respond(200, json=repo_search_data)
+
+        result = cli_runner.invoke(search_app, ["repos", "python", "--format", "table"], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert "Repository Search Results" in result.stdout
@@ -127,76 +150,45 @@ class TestSearchExecution:
         assert "Test repository" in result.stdout
         assert "Python" in result.stdout
 
-    @respx.mock
-    def test_search_repos_json_execution(self, runner, sample_repo_data):
+    def test_search_repos_json_execution(self, cli_runner, gh_mock, repo_search_data):
         """Test actual execution of repos search with JSON output."""
-        search_data = {
-            "total_count": 1,
-            "incomplete_results": False,
-            "items": [sample_repo_data],
-        }
-
-        respx.get("https://api.github.com/search/repositories").mock(return_value=httpx.Response(200, json=search_data))
+        gh_mock["repos"].respond(200, json=repo_search_data)
 
-        with patch.dict("os.environ", {"GITHUB_TOKEN": "test_token"}):
-            result = runner.invoke(search_app, ["repos", "python", "--format", "json"])
+        result = cli_runner.invoke(search_app, ["repos", "python", "--format", "json"], catch_exceptions=False)
 
         assert result.exit_code == 0
-        assert '"total_count": 1' in result.stdout
-        assert '"incomplete_results": false' in result.stdout
-        assert '"items":' in result.stdout
+        payload = json.loads(result.stdout)
+        assert payload["total_count"] == 1
+        assert payload["incomplete_results"] is False
+        assert len(payload["items"]) == 1
 
-    @respx.mock
-    def test_search_repos_output_file_execution(self, runner, sample_repo_data):
+    def test_search_repos_output_file_execution(self, cli_runner, gh_mock, repo_search_data, tmp_path, monkeypatch):
         """Test actual execution of repos search with file output."""
-        search_data = {
-            "total_count": 1,
-            "incomplete_results": False,
-            "items": [sample_repo_data],
-        }
-
-        respx.get("https://api.github.com/search/repositories").mock(return_value=httpx.Response(200, json=search_data))
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
-            output_file = f.name
-
-        try:
-            with patch.dict("os.environ", {"GITHUB_TOKEN": "test_token"}):
-                result = runner.invoke(
-                    search_app,
-                    ["repos", "python", "--format", "json", "--output", output_file],
-                )
-
-            assert result.exit_code == 0
-            assert "Results written to" in result.stdout
-            assert output_file in result.stdout
-
-            # Verify file contents
-            with open(output_file) as f:
-                content = f.read()
-                assert '"total_count": 1' in content
-                assert '"incomplete_results": false' in content
-        finally:
-            import os
-
-            try:
-                os.unlink(output_file)
-            except FileNotFoundError:
-                pass
-
-    @respx.mock
-    def test_search_users_table_execution(self, runner, sample_user_data):
-        """Test actual execution of users search with table output."""
-        search_data = {
-            "total_count": 1,
-            "incomplete_results": False,
-            "items": [sample_user_data],
-        }
+        gh_mock["repos"].respond(200, json=repo_search_data)
 
-        respx.get("https://api.github.com/search/users").mock(return_value=httpx.Response(200, json=search_data))
+        # Relative path, so the confirmation line is not wrapped by Rich
+        monkeypatch.chdir(tmp_path)
+        output_file = tmp_path / "results.json"
 
-        with patch.dict("os.environ", {"GITHUB_TOKEN": "test_token"}):
-            result = runner.invoke(search_app, ["users", "john", "--format", "table"])
+        result = cli_runner.invoke(
+            search_app,
+            ["repos", "python", "--format", "json", "--output", "results.json"],
+            catch_exceptions=False,
+        )
+
+        assert result.exit_code == 0
+        assert "Results written to" in result.stdout
+        assert "results.json" in result.stdout
+
+        payload = json.loads(output_file.read_text())
+        assert payload["total_count"] == 1
+        assert payload["incomplete_results"] is False
+
+    def test_search_users_table_execution(self, cli_runner, gh_mock, user_search_data):
+        """Test actual execution of users search with table output."""
+        gh_mock["users"].respond(200, json=user_search_data)
+
+        result = cli_runner.invoke(search_app, ["users", "john", "--format", "table"], catch_exceptions=False)
 
         assert result.exit_code == 0
         assert "User Search Results" in result.stdout
@@ -204,328 +196,161 @@ class TestSearchExecution:
         assert "Test User" in result.stdout
         assert "Test Company" in result.stdout
 
-    @respx.mock
-    def test_search_users_json_execution(self, runner, sample_user_data):
+    def test_search_users_json_execution(self, cli_runner, gh_mock, user_search_data):
         """Test actual execution of users search with JSON output."""
-        search_data = {
-            "total_count": 1,
-            "incomplete_results": False,
-            "items": [sample_user_data],
-        }
-
-        respx.get("https://api.github.com/search/users").mock(return_value=httpx.Response(200, json=search_data))
+        gh_mock["users"].respond(200, json=user_search_data)
 
-        with patch.dict("os.environ", {"GITHUB_TOKEN": "test_token"}):
-            result = runner.invoke(search_app, ["users", "john", "--format", "json"])
+        result = cli_runner.invoke(search_app, ["users", "john", "--format", "json"], catch_exceptions=False)
 
         assert result.exit_code == 0
-        assert '"total_count": 1' in result.stdout
-        assert '"incomplete_results": false' in result.stdout
-        assert '"items":' in result.stdout
+        payload = json.loads(result.stdout)
+        assert payload["total_count"] == 1
+        assert payload["incomplete_results"] is False
+        assert len(payload["items"]) == 1
 
-    @respx.mock
-    def test_search_users_output_file_execution(self, runner, sample_user_data):
+    def test_search_users_output_file_execution(self, cli_runner, gh_mock, user_search_data, tmp_path, monkeypatch):
         """Test actual execution of users search with file output."""
-        search_data = {
-            "total_count": 1,
-            "incomplete_results": False,
-            "items": [sample_user_data],
-        }
-
-        respx.get("https://api.github.com/search/users").mock(return_value=httpx.Response(200, json=search_data))
-
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
-            output_file = f.name
-
-        try:
-            with patch.dict("os.environ", {"GITHUB_TOKEN": "test_token"}):
-                result = runner.invoke(
-                    search_app,
-                    ["users", "john", "--format", "json", "--output", output_file],
-                )
-
-            assert result.exit_code == 0
-            assert "Results written to" in result.stdout
-            assert output_file in result.stdout
-
-            # Verify file contents
-            with open(output_file) as f:
-                content = f.read()
-                assert '"total_count": 1' in content
-                assert '"incomplete_results": false' in content
-        finally:
-            import os
-
-            try:
-                os.unlink(output_file)
-            except FileNotFoundError:
-                pass
-
-    def test_search_repos_authentication_error(self, runner):
-        """Test repos search with authentication error."""
-        with patch("mygh.cli.search.GitHubClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.search_repositories.side_effect = AuthenticationError("Invalid token")
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(search_app, ["repos", "python"])
-
-        assert result.exit_code == 1
-        assert "Authentication error: Invalid token" in result.stdout
-        assert "To authenticate:" in result.stdout
-        assert "Set GITHUB_TOKEN environment variable" in result.stdout
-
-    def test_search_repos_api_error(self, runner):
-        """Test repos search with API error."""
-        with patch("mygh.cli.search.GitHubClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.search_repositories.side_effect = APIError("API error")
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(search_app, ["repos", "python"])
-
-        assert result.exit_code == 1
-        assert "API error: API error" in result.stdout
-
-    def test_search_repos_mygh_exception(self, runner):
-        """Test repos search with MyGH exception."""
-        with patch("mygh.cli.search.GitHubClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.search_repositories.side_effect = MyGHException("MyGH error")
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(search_app, ["repos", "python"])
-
-        assert result.exit_code == 1
-        assert "Error: MyGH error" in result.stdout
-
-    def test_search_repos_keyboard_interrupt(self, runner):
-        """Test repos search with keyboard interrupt."""
-        with patch("mygh.cli.search.GitHubClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.search_repositories.side_effect = KeyboardInterrupt()
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(search_app, ["repos", "python"])
-
-        assert result.exit_code == 0
-        assert "Operation cancelled" in result.stdout
-
-    def test_search_repos_unexpected_error(self, runner):
-        """Test repos search with unexpected error."""
-        with patch("mygh.cli.search.GitHubClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.search_repositories.side_effect = ValueError("Unexpected error")
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(search_app, ["repos", "python"])
-
-        assert result.exit_code == 1
-        assert "Unexpected error: Unexpected error" in result.stdout
-
-    def test_search_users_authentication_error(self, runner):
-        """Test users search with authentication error."""
-        with patch("mygh.cli.search.GitHubClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.search_users.side_effect = AuthenticationError("Invalid token")
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(search_app, ["users", "john"])
-
-        assert result.exit_code == 1
-        assert "Authentication error: Invalid token" in result.stdout
-        assert "To authenticate:" in result.stdout
-        assert "Set GITHUB_TOKEN environment variable" in result.stdout
-
-    def test_search_users_api_error(self, runner):
-        """Test users search with API error."""
-        with patch("mygh.cli.search.GitHubClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.search_users.side_effect = APIError("API error")
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(search_app, ["users", "john"])
+        gh_mock["users"].respond(200, json=user_search_data)
 
-        assert result.exit_code == 1
-        assert "API error: API error" in result.stdout
-
-    def test_search_users_mygh_exception(self, runner):
-        """Test users search with MyGH exception."""
-        with patch("mygh.cli.search.GitHubClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.search_users.side_effect = MyGHException("MyGH error")
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(search_app, ["users", "john"])
-
-        assert result.exit_code == 1
-        assert "Error: MyGH error" in result.stdout
-
-    def test_search_users_keyboard_interrupt(self, runner):
-        """Test users search with keyboard interrupt."""
-        with patch("mygh.cli.search.GitHubClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.search_users.side_effect = KeyboardInterrupt()
-            mock_client_class.return_value = mock_client
+        # Relative path, so the confirmation line is not wrapped by Rich
+        monkeypatch.chdir(tmp_path)
+        output_file = tmp_path / "results.json"
 
-            result = runner.invoke(search_app, ["users", "john"])
+        result = cli_runner.invoke(
+            search_app,
+            ["users", "john", "--format", "json", "--output", "results.json"],
+            catch_exceptions=False,
+        )
 
         assert result.exit_code == 0
-        assert "Operation cancelled" in result.stdout
-
-    def test_search_users_unexpected_error(self, runner):
-        """Test users search with unexpected error."""
-        with patch("mygh.cli.search.GitHubClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client.search_users.side_effect = ValueError("Unexpected error")
-            mock_client_class.return_value = mock_client
-
-            result = runner.invoke(search_app, ["users", "john"])
+        assert "Results written to" in result.stdout
+        assert "results.json" in result.stdout
+
+        payload = json.loads(output_file.read_text())
+        assert payload["total_count"] == 1
+        assert payload["incomplete_results"] is False
+
+    @pytest.mark.parametrize(
+        ("argv", "route"),
+        [
+            pytest.param(["repos", "python"], "repos", id="repos"),
+            pytest.param(["users", "john"], "users", id="users"),
+        ],
+    )
+    @pytest.mark.parametrize(
+        ("status", "expected_output"),
+        [
+            pytest.param(
+                401,
+                [
+                    "Authentication error: Invalid or expired GitHub token",
+                    "To authenticate:",
+                    "Set GITHUB_TOKEN environment variable",
+                ],
+                id="authentication-error",
+            ),
+            pytest.param(500, ["API error: API error: Server Error"], id="api-error"),
+        ],
+    )
+    def test_search_http_error(self, cli_runner, gh_mock, argv, route, status, expected_output):
+        """Test that HTTP error responses from the search API are reported."""
+        gh_mock[route].respond(status, text="Server Error")
+
+        result = cli_runner.invoke(search_app, argv)
 
         assert result.exit_code == 1
-        assert "Unexpected error: Unexpected error" in result.stdout
+        for text in expected_output:
+            assert text in result.stdout
+
+    @pytest.mark.parametrize(
+        ("argv", "method"),
+        [
+            pytest.param(["repos", "python"], "search_repositories", id="repos"),
+            pytest.param(["users", "john"], "search_users", id="users"),
+        ],
+    )
+    @pytest.mark.parametrize(
+        ("error", "exit_code", "expected_output"),
+        [
+            pytest.param(MyGHException("MyGH error"), 1, ["Error: MyGH error"], id="mygh-exception"),
+            pytest.param(KeyboardInterrupt(), 0, ["Operation cancelled"], id="keyboard-interrupt"),
+            pytest.param(
+                ValueError("Unexpected error"), 1, ["Unexpected error: Unexpected error"], id="unexpected-error"
+            ),
+        ],
+    )
+    def test_search_error_handling(self, cli_runner, argv, method, error, exit_code, expected_output):
+        """Test that errors not reachable over HTTP are reported with the right exit code."""
+        client = StubGitHubClient(**{method: error})
+
+        with patch("mygh.cli.search.GitHubClient", return_value=client):
+            result = cli_runner.invoke(search_app, argv)
+
+        assert result.exit_code == exit_code
+        for text in expected_output:
+            assert text in result.stdout
 
     def test_handle_exceptions_decorator_sync_function(self):
         """Test handle_exceptions decorator with sync function."""
-        import typer
-
-        from mygh.cli.search import handle_exceptions
 
         @handle_exceptions
         def sync_func():
             raise ValueError("Test error")
 
-        with pytest.raises(typer.Exit):
+        with pytest.raises(typer.Exit) as exc_info:
             sync_func()
 
-    def test_handle_exceptions_decorator_async_function(self):
-        """Test handle_exceptions decorator with async function."""
-        import typer
-
-        from mygh.cli.search import handle_exceptions
+        assert exc_info.value.exit_code == 1
+
+    @pytest.mark.parametrize(
+        ("error", "exit_code"),
+        [
+            pytest.param(ValueError("Test error"), 1, id="unexpected-error"),
+            pytest.param(AuthenticationError("Auth error"), 1, id="authentication-error"),
+            pytest.param(APIError("API error"), 1, id="api-error"),
+            pytest.param(MyGHException("MyGH error"), 1, id="mygh-exception"),
+            pytest.param(KeyboardInterrupt(), 0, id="keyboard-interrupt"),
+        ],
+    )
+    def test_handle_exceptions_decorator_async_function(self, error, exit_code):
+        """Test that the decorator runs async functions and maps their errors to exits."""
 
         @handle_exceptions
         async def async_func():
-            raise ValueError("Test error")
+            raise error
 
-        with pytest.raises(typer.Exit):
+        # The wrapper drives the coroutine with asyncio.run, so it is called synchronously
+        with pytest.raises(typer.Exit) as exc_info:
             async_func()
 
-    def test_handle_exceptions_decorator_authentication_error(self):
-        """Test handle_exceptions decorator with authentication error."""
-        import typer
-
-        from mygh.cli.search import handle_exceptions
-
-        @handle_exceptions
-        async def func_with_auth_error():
-            raise AuthenticationError("Auth error")
-
-        with pytest.raises(typer.Exit):
-            func_with_auth_error()
-
-    def test_handle_exceptions_decorator_api_error(self):
-        """Test handle_exceptions decorator with API error."""
-        import typer
-
-        from mygh.cli.search import handle_exceptions
-
-        @handle_exceptions
-        async def func_with_api_error():
-            raise APIError("API error")
-
-        with pytest.raises(typer.Exit):
-            func_with_api_error()
-
-    def test_handle_exceptions_decorator_mygh_exception(self):
-        """Test handle_exceptions decorator with MyGH exception."""
-        import typer
-
-        from mygh.cli.search import handle_exceptions
-
-        @handle_exceptions
-        async def func_with_mygh_error():
-            raise MyGHException("MyGH error")
-
-        with pytest.raises(typer.Exit):
-            func_with_mygh_error()
-
-    def test_handle_exceptions_decorator_keyboard_interrupt(self):
-        """Test handle_exceptions decorator with keyboard interrupt."""
-        import typer
-
-        from mygh.cli.search import handle_exceptions
-
-        @handle_exceptions
-        async def func_with_keyboard_interrupt():
-            raise KeyboardInterrupt()
-
-        with pytest.raises(typer.Exit):
-            func_with_keyboard_interrupt()
-
-    def test_validation_functions_coverage(self):
-        """Test validation functions for coverage."""
-        import typer
-
-        from mygh.cli.search import (
-            validate_order,
-            validate_repo_sort,
-            validate_user_sort,
-        )
-
-        # Test repo sort validation
-        with pytest.raises(typer.Exit):
-            validate_repo_sort("invalid")
-
-        # Test user sort validation
-        with pytest.raises(typer.Exit):
-            validate_user_sort("invalid")
-
-        # Test order validation
-        with pytest.raises(typer.Exit):
-            validate_order("invalid")
-
-        # Test valid cases (should not raise)
-        validate_repo_sort(None)
-        validate_repo_sort("stars")
-        validate_user_sort(None)
-        validate_user_sort("followers")
-        validate_order("asc")
-        validate_order("desc")
-
-    def test_format_validation_execution(self, runner):
+        assert exc_info.value.exit_code == exit_code
+
+    @pytest.mark.parametrize(
+        ("validator", "value", "should_raise"),
+        [
+            pytest.param(validate_repo_sort, "invalid", True, id="repo-sort-invalid"),
+            pytest.param(validate_repo_sort, None, False, id="repo-sort-none"),
+            pytest.param(validate_repo_sort, "stars", False, id="repo-sort-stars"),
+            pytest.param(validate_user_sort, "invalid", True, id="user-sort-invalid"),
+            pytest.param(validate_user_sort, None, False, id="user-sort-none"),
+            pytest.param(validate_user_sort, "followers", False, id="user-sort-followers"),
+            pytest.param(validate_order, "invalid", True, id="order-invalid"),
+            pytest.param(validate_order, "asc", False, id="order-asc"),
+            pytest.param(validate_order, "desc", False, id="order-desc"),
+        ],
+    )
+    def test_validation_functions_coverage(self, validator, value, should_raise):
+        """Test that the option validators accept valid values and reject others."""
+        if should_raise:
+            with pytest.raises(typer.Exit):
+                validator(value)
+        else:
+            validator(value)
+
+    @pytest.mark.parametrize("argv", [["repos", "python"], ["users", "john"]], ids=["repos", "users"])
+    def test_format_validation_execution(self, cli_runner, argv):
         """Test format validation during execution."""
-        # Test invalid format for repos
-        with patch.dict("os.environ", {"GITHUB_TOKEN": "test_token"}):
-            result = runner.invoke(search_app, ["repos", "python", "--format", "invalid"])
-
-        assert result.exit_code == 1
-        assert "Invalid format: invalid" in result.stdout
-        assert "Available formats: table, json" in result.stdout
-
-        # Test invalid format for users
-        with patch.dict("os.environ", {"GITHUB_TOKEN": "test_token"}):
-            result = runner.invoke(search_app, ["users", "john", "--format", "invalid"])
+        result = cli_runner.invoke(search_app, [*argv, "--format", "invalid"])
 
         assert result.exit_code == 1
         assert "Invalid format: invalid" in result.stdout
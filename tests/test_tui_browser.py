@@ -1,7 +1,8 @@
 """Tests for the TUI browser functionality."""
 
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -13,88 +14,133 @@ from mygh.tui.browser import (
     RepositoryDetailsPane,
 )
 
+from ._stubs import StubGitHubClient
+
 
 @pytest.fixture
-def mock_github_client():
-    """Create a mock GitHub client."""
-    client = AsyncMock()
-    return client
+def github_client():
+    """Create a stub GitHub client; script results with ``reset``."""
+    return StubGitHubClient()
 
 
 @pytest.fixture
-def sample_repo():
-    """Create a sample repository for testing."""
-    owner = GitHubUser(
-        login="testowner",
-        id=123,
-        html_url="https://github.com/testowner",
-        avatar_url="https://github.com/testowner.png",
-    )
-
-    return GitHubRepo(
-        id=456,
-        name="test-repo",
-        full_name="testowner/test-repo",
-        owner=owner,
-        private=False,
-        fork=False,
-        html_url="https://github.com/testowner/test-repo",
-        clone_url="https://github.com/testowner/test-repo.git",
-        ssh_url="git@github.com:testowner/test-repo.git",
-        description="A test repository",
-        language="Python",
-        stargazers_count=42,
-        watchers_count=42,
-        forks_count=7,
-        open_issues_count=3,
-        size=1024,
-        default_branch="main",
-        created_at=datetime(2023, 1, 1, tzinfo=timezone.utc),
-        updated_at=datetime(2023, 12, 1, tzinfo=timezone.utc),
-        pushed_at=datetime(2023, 11, 30, tzinfo=timezone.utc),
-    )
+def no_populate_table(monkeypatch):
+    """Stub out ``populate_table``, which needs a mounted DataTable."""
+    monkeypatch.setattr(RepositoryBrowser, "populate_table", lambda self: None)
 
 
 @pytest.fixture
-def sample_repos(sample_repo):
-    """Create a list of sample repositories."""
-    repos = [sample_repo]
-
-    # Add a second repo
-    owner2 = GitHubUser(
-        login="testowner2",
-        id=124,
-        html_url="https://github.com/testowner2",
-        avatar_url="https://github.com/testowner2.png",
+def browser(github_client):
+    """Create a repository browser (no username) around the stub client."""
+    return RepositoryBrowser(github_client)
+
+
+def _make_user(login, user_id):
+    """Build a ``GitHubUser`` without validation; the payload is known-good."""
+    return GitHubUser.model_construct(
+        login=login,
+        id=user_id,
+        html_url=f"https://github.com/{login}",
+        avatar_url=f"https://github.com/{login}.png",
     )
 
-    repo2 = GitHubRepo(
-        id=457,
-        name="another-repo",
-        full_name="testowner2/another-repo",
-        owner=owner2,
-        private=True,
-        fork=False,
-        html_url="https://github.com/testowner2/another-repo",
-        clone_url="https://github.com/testowner2/another-repo.git",
-        ssh_url="git@github.com:testowner2/another-repo.git",
-        description="Another test repository",
-        language="JavaScript",
-        stargazers_count=123,
-        watchers_count=123,
-        forks_count=15,
-        open_issues_count=0,
-        size=2048,
-        default_branch="main",
-        created_at=datetime(2023, 6, 1, tzinfo=timezone.utc),
-        updated_at=datetime(2023, 12, 15, tzinfo=timezone.utc),
-        pushed_at=datetime(2023, 12, 14, tzinfo=timezone.utc),
-    )
 
-    repos.append(repo2)
+_BASE_REPO_KW = {
+    "id": 456,
+    "name": "test-repo",
+    "full_name": "testowner/test-repo",
+    "owner": _make_user("testowner", 123),
+    "private": False,
+    "fork": False,
+    "html_url": "https://github.com/testowner/test-repo",
+    "clone_url": "https://github.com/testowner/test-repo.git",
+    "ssh_url": "git@github.com:testowner/test-repo.git",
+    "description": "A test repository",
+    "language": "Python",
+    "stargazers_count": 42,
+    "watchers_count": 42,
+    "forks_count": 7,
+    "open_issues_count": 3,
+    "size": 1024,
+    "default_branch": "main",
+    "created_at": datetime(2023, 1, 1, tzinfo=timezone.utc),
+    "updated_at": datetime(2023, 12, 1, tzinfo=timezone.utc),
+    "pushed_at": datetime(2023, 11, 30, tzinfo=timezone.utc),
+}
+
+
+def _make_repo(**overrides):
+    """Build a ``GitHubRepo`` from ``_BASE_REPO_KW`` without validation."""
+    return GitHubRepo.model_construct(**{**_BASE_REPO_KW, **overrides})
+
+
+def _apply_starred(repos, starred):
+    """Mark ``repos`` as starred the way ``load_repositories`` does."""
+    starred_names = {repo.full_name for repo in starred}
+    for repo in repos:
+        repo.starred = repo.full_name in starred_names
     return repos
 
 
+# What the API hands back after forking the sample repo as "myuser"; the
+# browser only reads full_name from it, so just the identifying fields are set
+_FORKED_REPO = GitHubRepo.model_construct(
+    full_name="myuser/test-repo",
+    owner=_make_user("myuser", 999),
+    html_url="https://github.com/myuser/test-repo",
+)
+
+
+@pytest.fixture(scope="session")
+def shared_repos():
+    """Canonical sample repositories, built once per session.
+
+    Shared across tests, so never mutate them: tests that change a repo
+    (e.g. its ``starred`` flag) take ``sample_repo``/``sample_repos`` instead.
+    """
+    return [
+        _make_repo(),
+        _make_repo(
+            id=457,
+            name="another-repo",
+            full_name="testowner2/another-repo",
+            owner=_make_user("testowner2", 124),
+            private=True,
+            html_url="https://github.com/testowner2/another-repo",
+            clone_url="https://github.com/testowner2/another-repo.git",
+            ssh_url="git@github.com:testowner2/another-repo.git",
+            description="Another test repository",
+            language="JavaScript",
+            stargazers_count=123,
+            watchers_count=123,
+            forks_count=15,
+            open_issues_count=0,
+            size=2048,
+            created_at=datetime(2023, 6, 1, tzinfo=timezone.utc),
+            updated_at=datetime(2023, 12, 15, tzinfo=timezone.utc),
+            pushed_at=datetime(2023, 12, 14, tzinfo=timezone.utc),
+        ),
+    ]
+
+
+@pytest.fixture(scope="session")
+def shared_repo(shared_repos):
+    """Canonical sample repository; read-only, see ``shared_repos``."""
+    return shared_repos[0]
+
+
+@pytest.fixture
+def sample_repos(shared_repos):
+    """Private copies of the sample repositories that a test may mutate."""
+    return [repo.model_copy(deep=True) for repo in shared_repos]
+
+
+@pytest.fixture
+def sample_repo(sample_repos):
+    """Private copy of the first sample repository that a test may mutate."""
+    return sample_repos[0]
+
+
 class TestRepositoryDetailsPane:
     """Test the repository details pane."""
 
@@ -103,15 +149,15 @@ class TestRepositoryDetailsPane:
         pane = RepositoryDetailsPane()
         assert pane.repo is None
 
-    def test_update_repo(self, sample_repo):
+    def test_update_repo(self, shared_repo):
         """Test updating the repository details."""
         pane = RepositoryDetailsPane()
 
         # Mock the update method
         pane.update = MagicMock()
 
-        pane.update_repo(sample_repo)
-        assert pane.repo == sample_repo
+        pane.update_repo(shared_repo)
+        assert pane.repo == shared_repo
 
     def test_update_display_no_repo(self):
         """Test display update with no repository selected."""
@@ -121,23 +167,25 @@ class TestRepositoryDetailsPane:
         pane.update_display()
         pane.update.assert_called_once_with("Select a repository to view details")
 
-    def test_update_display_with_repo(self, sample_repo):
+    def test_update_display_with_repo(self, shared_repo):
         """Test display update with a repository."""
         pane = RepositoryDetailsPane()
         pane.update = MagicMock()
-        pane.repo = sample_repo
+        pane.repo = shared_repo
 
         pane.update_display()
 
         # Verify that update was called with formatted repository details
         pane.update.assert_called_once()
-        call_args = pane.update.call_args[0][0]
+        lines = set(pane.update.call_args[0][0].splitlines())
 
-        assert "testowner/test-repo" in call_args
-        assert "A test repository" in call_args
-        assert "Python" in call_args
-        assert "42" in call_args  # stargazers_count
-        assert "7" in call_args  # forks_count
+        assert {
+            "[bold cyan]testowner/test-repo[/bold cyan]",
+            "A test repository",
+            "[bold]Language:[/bold] Python",
+            "[bold]Stars:[/bold] 42",
+            "[bold]Forks:[/bold] 7",
+        } <= lines
 
 
 class TestQuickActionsPane:
@@ -148,7 +196,7 @@ class TestQuickActionsPane:
         pane = QuickActionsPane()
         assert pane.repo is None
 
-    def test_update_repo(self, sample_repo):
+    def test_update_repo(self, shared_repo):
         """Test updating the repository for actions."""
         pane = QuickActionsPane()
 
@@ -156,29 +204,29 @@ class TestQuickActionsPane:
         mock_button = MagicMock()
         pane.query_one = MagicMock(return_value=mock_button)
 
-        pane.update_repo(sample_repo)
-        assert pane.repo == sample_repo
+        pane.update_repo(shared_repo)
+        assert pane.repo == shared_repo
 
 
 class TestRepositoryActionMessage:
     """Test the repository action message."""
 
-    def test_message_creation(self, sample_repo):
+    def test_message_creation(self, shared_repo):
         """Test creating a repository action message."""
-        message = RepositoryActionMessage("star", sample_repo)
+        message = RepositoryActionMessage("star", shared_repo)
         assert message.action == "star"
-        assert message.repo == sample_repo
+        assert message.repo == shared_repo
 
 
+@pytest.mark.usefixtures("no_populate_table")
 class TestRepositoryBrowser:
     """Test the main repository browser application."""
 
-    @pytest.mark.asyncio
-    async def test_initialization(self, mock_github_client):
+    async def test_initialization(self, github_client):
         """Test browser initialization."""
-        browser = RepositoryBrowser(mock_github_client, "testuser")
+        browser = RepositoryBrowser(github_client, "testuser")
 
-        assert browser.github_client == mock_github_client
+        assert browser.github_client == github_client
         assert browser.username == "testuser"
         assert browser.title == "MyGH - Interactive Repository Browser"
         assert browser.sub_title == "User: testuser"
@@ -187,99 +235,67 @@ class TestRepositoryBrowser:
         assert browser.selected_repo is None
         assert browser.search_query == ""
 
-    @pytest.mark.asyncio
-    async def test_initialization_no_username(self, mock_github_client):
+    async def test_initialization_no_username(self, browser):
         """Test browser initialization without username."""
-        browser = RepositoryBrowser(mock_github_client)
-
         assert browser.username is None
         assert browser.sub_title == "All Repositories"
 
-    def test_load_repositories_with_username(self, mock_github_client, sample_repos):
+    async def test_load_repositories_with_username(self, github_client, sample_repos):
         """Test loading repositories for a specific user."""
-        mock_github_client.get_user_repos.return_value = sample_repos
-        mock_github_client.get_starred_repos.return_value = [sample_repos[0]]  # First repo is starred
+        # First repo is starred
+        github_client.reset(get_user_repos=sample_repos, get_starred_repos=[sample_repos[0]])
 
-        browser = RepositoryBrowser(mock_github_client, "testuser")
-        browser.populate_table = MagicMock()
+        browser = RepositoryBrowser(github_client, "testuser")
         browser.notify = MagicMock()
 
         # Simulate the load_repositories method manually since @work complicates testing
-        async def simulate_load():
-            repos = await mock_github_client.get_user_repos("testuser")
-            starred = await mock_github_client.get_starred_repos("testuser")
+        repos = await github_client.get_user_repos("testuser")
+        starred = await github_client.get_starred_repos("testuser")
 
-            starred_names = {repo.full_name for repo in starred}
-            for repo in repos:
-                repo.starred = repo.full_name in starred_names
-
-            browser.repositories = repos
-            browser.filtered_repositories = repos
-            browser.populate_table()
+        _apply_starred(repos, starred)
 
-        # Run the simulation
-        import asyncio
+        browser.repositories = repos
+        browser.filtered_repositories = repos
+        browser.populate_table()
 
-        asyncio.run(simulate_load())
-
-        mock_github_client.get_user_repos.assert_called_once_with("testuser")
-        mock_github_client.get_starred_repos.assert_called_once_with("testuser")
+        assert github_client.calls_to("get_user_repos") == [(("testuser",), {})]
+        assert github_client.calls_to("get_starred_repos") == [(("testuser",), {})]
 
         assert len(browser.repositories) == 2
         assert hasattr(browser.repositories[0], "starred")
         assert browser.repositories[0].starred is True
         assert browser.repositories[1].starred is False
 
-    def test_load_repositories_authenticated_user(self, mock_github_client, sample_repos):
+    async def test_load_repositories_authenticated_user(self, github_client, browser, sample_repos):
         """Test loading repositories for authenticated user."""
-        mock_user = GitHubUser(
-            login="authuser",
-            id=999,
-            html_url="https://github.com/authuser",
-            avatar_url="https://github.com/authuser.png",
-        )
+        mock_user = _make_user("authuser", 999)
 
-        mock_github_client.get_authenticated_user.return_value = mock_user
-        mock_github_client.get_user_repos.return_value = sample_repos
-        mock_github_client.get_starred_repos.return_value = []
+        github_client.reset(get_authenticated_user=mock_user, get_user_repos=sample_repos, get_starred_repos=[])
 
-        browser = RepositoryBrowser(mock_github_client)
-        browser.populate_table = MagicMock()
         browser.notify = MagicMock()
 
         # Simulate the load_repositories method manually since @work complicates testing
-        async def simulate_load():
-            user = await mock_github_client.get_authenticated_user()
-            repos = await mock_github_client.get_user_repos(user.login)
-            starred = await mock_github_client.get_starred_repos(user.login)
-
-            starred_names = {repo.full_name for repo in starred}
-            for repo in repos:
-                repo.starred = repo.full_name in starred_names
+        user = await github_client.get_authenticated_user()
+        repos = await github_client.get_user_repos(user.login)
+        starred = await github_client.get_starred_repos(user.login)
 
-            browser.repositories = repos
-            browser.filtered_repositories = repos
-            browser.populate_table()
-
-        # Run the simulation
-        import asyncio
+        _apply_starred(repos, starred)
 
-        asyncio.run(simulate_load())
+        browser.repositories = repos
+        browser.filtered_repositories = repos
+        browser.populate_table()
 
-        mock_github_client.get_authenticated_user.assert_called_once()
-        mock_github_client.get_user_repos.assert_called_once_with("authuser")
-        mock_github_client.get_starred_repos.assert_called_once_with("authuser")
+        assert github_client.calls_to("get_authenticated_user") == [((), {})]
+        assert github_client.calls_to("get_user_repos") == [(("authuser",), {})]
+        assert github_client.calls_to("get_starred_repos") == [(("authuser",), {})]
 
-    def test_filter_repositories_by_search(self, mock_github_client, sample_repos):
+    def test_filter_repositories_by_search(self, browser, shared_repos):
         """Test filtering repositories by search query."""
-        browser = RepositoryBrowser(mock_github_client)
-        browser.repositories = sample_repos
-        browser.populate_table = MagicMock()
+        browser.repositories = shared_repos
 
         # Mock the filter options
-        mock_option_list = MagicMock()
-        mock_option_list.highlighted = None
-        browser.query_one = MagicMock(return_value=mock_option_list)
+        mock_option_list = SimpleNamespace(highlighted=None)
+        browser.query_one = lambda *_: mock_option_list
 
         # Test search by name
         browser.search_query = "test-repo"
@@ -295,11 +311,9 @@ class TestRepositoryBrowser:
         assert len(browser.filtered_repositories) == 1
         assert browser.filtered_repositories[0].language == "JavaScript"
 
-    def test_filter_repositories_by_category(self, mock_github_client, sample_repos):
+    def test_filter_repositories_by_category(self, browser, sample_repos):
         """Test filtering repositories by category."""
-        browser = RepositoryBrowser(mock_github_client)
         browser.repositories = sample_repos
-        browser.populate_table = MagicMock()
         browser.search_query = ""
 
         # Mark first repo as starred for testing
@@ -307,96 +321,53 @@ class TestRepositoryBrowser:
         sample_repos[1].starred = False
 
         # Mock filter selection
-        mock_option = MagicMock()
-        mock_option.id = "starred"
-        mock_option_list = MagicMock()
-        mock_option_list.highlighted = 0
-        mock_option_list.get_option_at_index.return_value = mock_option
-        browser.query_one = MagicMock(return_value=mock_option_list)
+        mock_option = SimpleNamespace(id="starred")
+        mock_option_list = SimpleNamespace(highlighted=0, get_option_at_index=lambda _: mock_option)
+        browser.query_one = lambda *_: mock_option_list
 
         browser.filter_repositories()
 
         assert len(browser.filtered_repositories) == 1
         assert browser.filtered_repositories[0].starred is True
 
-    @pytest.mark.asyncio
-    async def test_handle_star_action(self, mock_github_client, sample_repo):
-        """Test handling star action."""
-        browser = RepositoryBrowser(mock_github_client)
+    @pytest.mark.parametrize(
+        ("was_starred", "method", "notice"),
+        [
+            pytest.param(False, "star_repository", "Starred testowner/test-repo", id="star"),
+            pytest.param(True, "unstar_repository", "Unstarred testowner/test-repo", id="unstar"),
+        ],
+    )
+    async def test_handle_star_action(self, github_client, browser, sample_repo, was_starred, method, notice):
+        """Test that the star action toggles the repository's starred state."""
         browser.notify = MagicMock()
         browser.update_actions_pane = MagicMock()
 
-        # Test starring a repository
-        sample_repo.starred = False
+        sample_repo.starred = was_starred
         message = RepositoryActionMessage("star", sample_repo)
 
         await browser.handle_repository_action(message)
 
-        mock_github_client.star_repository.assert_called_once_with("testowner", "test-repo")
-        assert sample_repo.starred is True
-        browser.notify.assert_called_with("Starred testowner/test-repo")
+        assert github_client.calls_to(method) == [(("testowner", "test-repo"), {})]
+        assert sample_repo.starred is not was_starred
+        browser.notify.assert_called_with(notice)
         browser.update_actions_pane.assert_called_once_with(sample_repo)
 
-    @pytest.mark.asyncio
-    async def test_handle_unstar_action(self, mock_github_client, sample_repo):
-        """Test handling unstar action."""
-        browser = RepositoryBrowser(mock_github_client)
-        browser.notify = MagicMock()
-        browser.update_actions_pane = MagicMock()
-
-        # Test unstarring a repository
-        sample_repo.starred = True
-        message = RepositoryActionMessage("star", sample_repo)
-
-        await browser.handle_repository_action(message)
-
-        mock_github_client.unstar_repository.assert_called_once_with("testowner", "test-repo")
-        assert sample_repo.starred is False
-        browser.notify.assert_called_with("Unstarred testowner/test-repo")
-
-    @pytest.mark.asyncio
-    async def test_handle_fork_action(self, mock_github_client, sample_repo):
+    async def test_handle_fork_action(self, github_client, browser, shared_repo):
         """Test handling fork action."""
-        forked_repo = GitHubRepo(
-            id=789,
-            name="test-repo",
-            full_name="myuser/test-repo",
-            owner=GitHubUser(
-                login="myuser", id=999, html_url="https://github.com/myuser", avatar_url="https://github.com/myuser.png"
-            ),
-            private=False,
-            fork=True,
-            html_url="https://github.com/myuser/test-repo",
-            clone_url="https://github.com/myuser/test-repo.git",
-            ssh_url="git@github.com:myuser/test-repo.git",
-            stargazers_count=0,
-            watchers_count=0,
-            forks_count=0,
-            open_issues_count=0,
-            size=512,
-            default_branch="main",
-            created_at=datetime(2023, 1, 1, tzinfo=timezone.utc),
-            updated_at=datetime(2023, 12, 1, tzinfo=timezone.utc),
-            pushed_at=datetime(2023, 11, 30, tzinfo=timezone.utc),
-        )
-
-        browser = RepositoryBrowser(mock_github_client)
         browser.notify = MagicMock()
-        mock_github_client.fork_repository.return_value = forked_repo
+        github_client.reset(fork_repository=_FORKED_REPO)
 
-        message = RepositoryActionMessage("fork", sample_repo)
+        message = RepositoryActionMessage("fork", shared_repo)
         await browser.handle_repository_action(message)
 
-        mock_github_client.fork_repository.assert_called_once_with("testowner", "test-repo")
+        assert github_client.calls_to("fork_repository") == [(("testowner", "test-repo"), {})]
         browser.notify.assert_called_with("Forked testowner/test-repo to myuser/test-repo")
 
-    @pytest.mark.asyncio
-    async def test_handle_clone_action(self, mock_github_client, sample_repo):
+    async def test_handle_clone_action(self, browser, shared_repo):
         """Test handling clone action."""
-        browser = RepositoryBrowser(mock_github_client)
         browser.notify = MagicMock()
 
-        message = RepositoryActionMessage("clone", sample_repo)
+        message = RepositoryActionMessage("clone", shared_repo)
 
         # Test without pyperclip
         with patch.dict("sys.modules", {"pyperclip": None}):
@@ -404,38 +375,29 @@ class TestRepositoryBrowser:
             browser.notify.assert_called_with("Clone URL: https://github.com/testowner/test-repo.git")
 
         # Test with pyperclip
-        with patch(
-            "builtins.__import__",
-            side_effect=lambda name, *args: MagicMock() if name == "pyperclip" else __import__(name, *args),
-        ):
-            mock_pyperclip = MagicMock()
-            with patch.dict("sys.modules", {"pyperclip": mock_pyperclip}):
-                await browser.handle_repository_action(message)
-                browser.notify.assert_called_with(
-                    "Copied clone URL to clipboard: https://github.com/testowner/test-repo.git"
-                )
-
-    @pytest.mark.asyncio
-    async def test_handle_browser_action(self, mock_github_client, sample_repo):
+        with patch.dict("sys.modules", {"pyperclip": SimpleNamespace(copy=lambda _: None)}):
+            await browser.handle_repository_action(message)
+            browser.notify.assert_called_with(
+                "Copied clone URL to clipboard: https://github.com/testowner/test-repo.git"
+            )
+
+    @patch("webbrowser.open")
+    async def test_handle_browser_action(self, mock_open, browser, shared_repo):
         """Test handling browser action."""
-        browser = RepositoryBrowser(mock_github_client)
         browser.notify = MagicMock()
 
-        message = RepositoryActionMessage("browser", sample_repo)
+        message = RepositoryActionMessage("browser", shared_repo)
+        await browser.handle_repository_action(message)
 
-        with patch("webbrowser.open") as mock_open:
-            await browser.handle_repository_action(message)
-            mock_open.assert_called_once_with("https://github.com/testowner/test-repo")
-            browser.notify.assert_called_with("Opened testowner/test-repo in browser")
+        mock_open.assert_called_once_with("https://github.com/testowner/test-repo")
+        browser.notify.assert_called_with("Opened testowner/test-repo in browser")
 
-    @pytest.mark.asyncio
-    async def test_handle_action_error(self, mock_github_client, sample_repo):
+    async def test_handle_action_error(self, github_client, browser, sample_repo):
         """Test handling action errors."""
-        browser = RepositoryBrowser(mock_github_client)
         browser.notify = MagicMock()
 
         # Mock an API error
-        mock_github_client.star_repository.side_effect = Exception("API Error")
+        github_client.reset(star_repository=Exception("API Error"))
 
         message = RepositoryActionMessage("star", sample_repo)
         await browser.handle_repository_action(message)
@@ -447,70 +409,59 @@ class TestRepositoryBrowser:
 class TestBrowserIntegration:
     """Integration tests for the browser with mocked API calls."""
 
-    def test_full_workflow(self, mock_github_client, sample_repos):
-        """Test a complete workflow with the browser."""
-        # Setup mocks
-        mock_user = GitHubUser(
-            login="testuser",
-            id=123,
-            html_url="https://github.com/testuser",
-            avatar_url="https://github.com/testuser.png",
+    async def test_full_workflow_load(self, github_client, browser, sample_repos):
+        """Test the load step of the browser workflow."""
+        mock_user = _make_user("testuser", 123)
+        github_client.reset(
+            get_authenticated_user=mock_user, get_user_repos=sample_repos, get_starred_repos=[sample_repos[0]]
         )
 
-        mock_github_client.get_authenticated_user.return_value = mock_user
-        mock_github_client.get_user_repos.return_value = sample_repos
-        mock_github_client.get_starred_repos.return_value = [sample_repos[0]]
-
-        # Create browser
-        browser = RepositoryBrowser(mock_github_client)
         browser.populate_table = MagicMock()
-        browser.notify = MagicMock()
 
         # Simulate loading repositories manually since @work complicates testing
-        async def simulate_workflow():
-            user = await mock_github_client.get_authenticated_user()
-            repos = await mock_github_client.get_user_repos(user.login)
-            starred = await mock_github_client.get_starred_repos(user.login)
-
-            starred_names = {repo.full_name for repo in starred}
-            for repo in repos:
-                repo.starred = repo.full_name in starred_names
-
-            browser.repositories = repos
-            browser.filtered_repositories = repos
-            browser.populate_table()
-
-            # Test repository action - mock the update_actions_pane to avoid screen stack issues
-            browser.update_actions_pane = MagicMock()
-            sample_repos[0].starred = False
-            message = RepositoryActionMessage("star", sample_repos[0])
-            await browser.handle_repository_action(message)
+        user = await github_client.get_authenticated_user()
+        repos = await github_client.get_user_repos(user.login)
+        starred = await github_client.get_starred_repos(user.login)
 
-        # Run the simulation
-        import asyncio
+        _apply_starred(repos, starred)
 
-        asyncio.run(simulate_workflow())
+        browser.repositories = repos
+        browser.filtered_repositories = repos
+        browser.populate_table()
 
-        # Verify data was loaded
         assert len(browser.repositories) == 2
         assert browser.repositories[0].starred is True
         assert browser.repositories[1].starred is False
+        browser.populate_table.assert_called_once()
+
+    @pytest.mark.usefixtures("no_populate_table")
+    def test_full_workflow_filter(self, browser, shared_repos):
+        """Test the filter step of the browser workflow."""
+        browser.repositories = shared_repos
 
-        # Test filtering
         browser.search_query = "python"
-        browser.query_one = MagicMock(return_value=MagicMock(highlighted=None))
+        browser.query_one = lambda *_: SimpleNamespace(highlighted=None)
         browser.filter_repositories()
 
         assert len(browser.filtered_repositories) == 1
         assert browser.filtered_repositories[0].language == "Python"
 
-        mock_github_client.star_repository.assert_called_once()
+    async def test_full_workflow_action(self, github_client, browser, sample_repo):
+        """Test the action step of the browser workflow."""
+        browser.notify = MagicMock()
+        # Mock update_actions_pane to avoid screen stack issues
+        browser.update_actions_pane = MagicMock()
+
+        message = RepositoryActionMessage("star", sample_repo)
+        await browser.handle_repository_action(message)
+
+        assert len(github_client.calls_to("star_repository")) == 1
+        assert sample_repo.starred is True
         browser.notify.assert_called_with("Starred testowner/test-repo")
 
-    def test_populate_table_method(self, mock_github_client, sample_repos):
+    def test_populate_table_method(self, browser, shared_repos):
         """Test the populate_table method."""
-        browser = RepositoryBrowser(mock_github_client)
-        browser.filtered_repositories = sample_repos
+        browser.filtered_repositories = shared_repos
 
         # Mock the table update methods
         with patch.object(browser, "query_one") as mock_query:
@@ -522,90 +473,80 @@ class TestBrowserIntegration:
 
             # Verify table methods were called
             mock_table.clear.assert_called_once()
-            assert mock_table.add_row.call_count >= len(sample_repos)
+            assert mock_table.add_row.call_count >= len(shared_repos)
 
-    def test_update_details_pane_method(self, mock_github_client, sample_repo):
+    def test_update_details_pane_method(self, browser, shared_repo):
         """Test the update_details_pane method."""
-        browser = RepositoryBrowser(mock_github_client)
-
         # Mock the details pane
         with patch.object(browser, "query_one") as mock_query:
             mock_pane = MagicMock()
             mock_query.return_value = mock_pane
 
             # Test update_details_pane
-            browser.update_details_pane(sample_repo)
+            browser.update_details_pane(shared_repo)
 
             # Verify pane was updated
-            mock_pane.update_repo.assert_called_once_with(sample_repo)
+            mock_pane.update_repo.assert_called_once_with(shared_repo)
 
-    def test_update_actions_pane_method(self, mock_github_client, sample_repo):
+    def test_update_actions_pane_method(self, browser, shared_repo):
         """Test the update_actions_pane method."""
-        browser = RepositoryBrowser(mock_github_client)
-
         # Mock the actions pane
         with patch.object(browser, "query_one") as mock_query:
             mock_pane = MagicMock()
             mock_query.return_value = mock_pane
 
             # Test update_actions_pane
-            browser.update_actions_pane(sample_repo)
+            browser.update_actions_pane(shared_repo)
 
             # Verify pane was updated
-            mock_pane.update_repo.assert_called_once_with(sample_repo)
+            mock_pane.update_repo.assert_called_once_with(shared_repo)
 
-    def test_browser_basic_methods(self, mock_github_client):
+    def test_browser_basic_methods(self, github_client, browser):
         """Test basic browser methods that don't require UI."""
-        browser = RepositoryBrowser(mock_github_client)
-
         # Test basic attribute access
-        assert browser.github_client == mock_github_client
+        assert browser.github_client == github_client
         assert browser.repositories == []
         assert browser.filtered_repositories == []
         assert browser.selected_repo is None
         assert browser.search_query == ""
 
-    def test_filter_repositories_edge_cases(self, mock_github_client, sample_repos):
+    @pytest.mark.usefixtures("no_populate_table")
+    def test_filter_repositories_edge_cases(self, browser, shared_repos):
         """Test edge cases in filter_repositories method."""
-        browser = RepositoryBrowser(mock_github_client)
-        browser.repositories = sample_repos
-        browser.populate_table = MagicMock()
+        browser.repositories = shared_repos
 
         # Mock empty option list
-        mock_option_list = MagicMock()
-        mock_option_list.highlighted = None
-        browser.query_one = MagicMock(return_value=mock_option_list)
+        mock_option_list = SimpleNamespace(highlighted=None)
+        browser.query_one = lambda *_: mock_option_list
 
         # Test with empty search query
         browser.search_query = ""
         browser.filter_repositories()
-        assert len(browser.filtered_repositories) == len(sample_repos)
+        assert len(browser.filtered_repositories) == len(shared_repos)
 
         # Test with search query that matches nothing
         browser.search_query = "nonexistent"
         browser.filter_repositories()
         assert len(browser.filtered_repositories) == 0
 
-    def test_browser_initialization_edge_cases(self, mock_github_client):
+    def test_browser_initialization_edge_cases(self, github_client):
         """Test browser initialization with different parameters."""
         # Test with username
-        browser_with_user = RepositoryBrowser(mock_github_client, "testuser")
+        browser_with_user = RepositoryBrowser(github_client, "testuser")
         assert browser_with_user.username == "testuser"
         assert "testuser" in browser_with_user.sub_title
 
         # Test without username
-        browser_no_user = RepositoryBrowser(mock_github_client, None)
+        browser_no_user = RepositoryBrowser(github_client, None)
         assert browser_no_user.username is None
         assert "All Repositories" in browser_no_user.sub_title
 
-    def test_repository_message_handling(self, mock_github_client, sample_repo):
+    def test_repository_message_handling(self, browser, shared_repo):
         """Test repository message creation and handling."""
-        browser = RepositoryBrowser(mock_github_client)
-
         # Test message creation
-        message = RepositoryActionMessage("test_action", sample_repo)
+        message = RepositoryActionMessage("test_action", shared_repo)
         assert message.action == "test_action"
-        assert message.repo == sample_repo
+        assert message.repo == shared_repo
 
         # Test message handling (basic verification)
         browser.notify = MagicMock()
@@ -614,10 +555,8 @@ class TestBrowserIntegration:
         # This would normally be async, but we can test the sync parts
         assert hasattr(browser, "handle_repository_action")
 
-    def test_browser_attribute_setting(self, mock_github_client):
+    def test_browser_attribute_setting(self, browser):
         """Test setting browser attributes."""
-        browser = RepositoryBrowser(mock_github_client)
-
         # Test setting title and subtitle
 
         browser.title = "New Title"
@@ -626,18 +565,17 @@ class TestBrowserIntegration:
         assert browser.title == "New Title"
         assert browser.sub_title == "New Subtitle"
 
-    @pytest.mark.asyncio
-    async def test_error_handling_during_load(self, mock_github_client):
+    async def test_error_handling_during_load(self, github_client):
         """Test error handling during repository loading."""
-        browser = RepositoryBrowser(mock_github_client, "testuser")
+        browser = RepositoryBrowser(github_client, "testuser")
         browser.notify = MagicMock()
 
         # Mock API error
-        mock_github_client.get_user_repos.side_effect = Exception("API Error")
+        github_client.reset(get_user_repos=Exception("API Error"))
 
         # Simulate load_repositories error handling
         try:
-            await mock_github_client.get_user_repos("testuser")
+            await github_client.get_user_repos("testuser")
         except Exception as e:
             browser.notify(f"Error loading repositories: {e}", severity="error")
 